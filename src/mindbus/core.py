@@ -14,7 +14,7 @@ import json
 import logging
 import os
 from datetime import datetime
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Sequence
 from uuid import uuid4
 
 import pika
@@ -604,6 +604,7 @@ class MindBus:
         routing_pattern: str,
         callback: Callable[[CloudEvent, Dict[str, Any]], None],
         queue_name: Optional[str] = None,
+        extra_patterns: Sequence[str] = (),
     ) -> str:
         """
         Subscribe to messages matching a routing pattern.
@@ -612,6 +613,9 @@ class MindBus:
             routing_pattern: AMQP routing key pattern (e.g., "cmd.writer.*")
             callback: Function to call with (cloud_event, validated_data)
             queue_name: Optional queue name (auto-generated if not provided)
+            extra_patterns: More routing patterns bound to the same queue.
+                One queue and one consumer serve all patterns, and the broker
+                delivers a message once even if several patterns match.
 
         Returns:
             Queue name
@@ -622,12 +626,13 @@ class MindBus:
         # Declare queue
         self._channel.queue_declare(queue=queue_name, durable=True)
 
-        # Bind queue to exchange with routing pattern
-        self._channel.queue_bind(
-            exchange=self.config.exchange_name,
-            queue=queue_name,
-            routing_key=routing_pattern,
-        )
+        # Bind queue to exchange with routing pattern(s)
+        for pattern in (routing_pattern, *extra_patterns):
+            self._channel.queue_bind(
+                exchange=self.config.exchange_name,
+                queue=queue_name,
+                routing_key=pattern,
+            )
 
         def on_message(ch, method, properties, body):
             try:
@@ -678,9 +683,11 @@ class MindBus:
                     logger.warning(f"Failed to NACK message (channel may be closed): {nack_err}")
 
         self._channel.basic_consume(queue=queue_name, on_message_callback=on_message)
-        self._callbacks[routing_pattern] = callback
+        for pattern in (routing_pattern, *extra_patterns):
+            self._callbacks[pattern] = callback
 
-        logger.info(f"Subscribed to {routing_pattern} via queue {queue_name}")
+        patterns = ", ".join((routing_pattern, *extra_patterns))
+        logger.info(f"Subscribed to {patterns} via queue {queue_name}")
         return queue_name
 
     def subscribe_queue(
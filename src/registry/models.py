@@ -5,10 +5,11 @@ Based on: docs/SSOT/NODE_PASSPORT_SPEC_v1.0.md
 Pattern: Kubernetes API Object Model (metadata/spec/status)
 """
 
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 import uuid
 
 
@@ -154,6 +155,18 @@ class NodeSpec(BaseModel):
         description="Node configuration"
     )
 
+    # name -> Capability, built once after validation. Capabilities are
+    # declared at startup and not changed afterwards (only status is).
+    _cap_index: Dict[str, Capability] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Build the capability lookup map."""
+        self._cap_index = {cap.name: cap for cap in self.capabilities}
+
+    def get_capability(self, name: str) -> Optional[Capability]:
+        """Get a declared capability by name."""
+        return self._cap_index.get(name)
+
 
 # =============================================================================
 # Condition
@@ -253,12 +266,19 @@ class NodePassport(BaseModel):
 
     def has_capability(self, capability_name: str) -> bool:
         """Check if node has a specific capability."""
-        return any(cap.name == capability_name for cap in self.spec.capabilities)
+        return capability_name in self.spec._cap_index
 
     def matches_labels(self, selector: Dict[str, str]) -> bool:
         """Check if node labels match the selector (AND logic)."""
+        # Fast paths: most selectors are empty or have a single key
+        if not selector:
+            return True
+        labels = self.metadata.labels
+        if len(selector) == 1:
+            ((key, value),) = selector.items()
+            return labels.get(key) == value
         for key, value in selector.items():
-            if self.metadata.labels.get(key) != value:
+            if labels.get(key) != value:
                 return False
         return True
 
@@ -267,24 +287,25 @@ class NodePassport(BaseModel):
 # Registry Entry (internal model for registry storage)
 # =============================================================================
 
-class RegistryEntry(BaseModel):
+@dataclass(slots=True)
+class RegistryEntry:
     """
     Internal model for storing node in registry.
 
-    Adds registry-specific metadata to NodePassport.
+    Adds registry-specific metadata to NodePassport. Never sent over the
+    wire, so it is a plain slotted dataclass rather than a Pydantic model.
+
+    Attributes:
+        node_id: Node UID from metadata.
+        node_type: Node type.
+        passport: Full node passport.
+        last_seen: Last heartbeat time.
+        health_state: Health state.
+        registered_at: Registration time.
     """
-    node_id: str = Field(..., description="Node UID from metadata")
-    node_type: NodeType = Field(..., description="Node type")
-    passport: NodePassport = Field(..., description="Full node passport")
-    last_seen: datetime = Field(
-        default_factory=datetime.utcnow,
-        description="Last heartbeat time"
-    )
-    health_state: HealthState = Field(
-        default=HealthState.ALIVE,
-        description="Health state"
-    )
-    registered_at: datetime = Field(
-        default_factory=datetime.utcnow,
-        description="Registration time"
-    )
+    node_id: str
+    node_type: NodeType
+    passport: NodePassport
+    last_seen: datetime = field(default_factory=datetime.utcnow)
+    health_state: HealthState = HealthState.ALIVE
+    registered_at: datetime = field(default_factory=datetime.utcnow)
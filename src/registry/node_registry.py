@@ -10,11 +10,16 @@ For production, use etcd or Consul as backend.
 import logging
 import threading
 import time
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Tuple
 
-import yaml
+try:
+    from ..yaml_config import load_yaml_file
+except ImportError:
+    # Imported as top-level "registry" (src/ on sys.path, as tests and demos do)
+    from yaml_config import load_yaml_file
 
 from .models import (
     NodePassport,
@@ -33,6 +38,78 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Cleanup thread wait when no node is registered (registration wakes it)
+IDLE_CLEANUP_WAIT_SECONDS = 60.0
+
+
+class ReadWriteLock:
+    """
+    Reader-writer lock built on threading.Condition.
+
+    Many readers may hold the lock at once; a writer gets exclusive access.
+    The writer side is reentrant, and the owning writer may also take the
+    read side.
+    Fair to writers: once a writer waits, new readers queue behind it, so
+    steady discovery traffic cannot starve registration and cleanup. The
+    read side is therefore not reentrant.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer: Optional[int] = None
+        self._writer_depth = 0
+        self._writers_waiting = 0
+
+    @contextmanager
+    def read_lock(self):
+        """Acquire shared (read) access."""
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer == me:
+                self._writer_depth += 1
+                owner = True
+            else:
+                while self._writer is not None or self._writers_waiting:
+                    self._cond.wait()
+                self._readers += 1
+                owner = False
+        try:
+            yield
+        finally:
+            with self._cond:
+                if owner:
+                    self._writer_depth -= 1
+                else:
+                    self._readers -= 1
+                    if self._readers == 0:
+                        self._cond.notify_all()
+
+    @contextmanager
+    def write_lock(self):
+        """Acquire exclusive (write) access."""
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer == me:
+                self._writer_depth += 1
+            else:
+                self._writers_waiting += 1
+                try:
+                    while self._writer is not None or self._readers > 0:
+                        self._cond.wait()
+                finally:
+                    self._writers_waiting -= 1
+                self._writer = me
+                self._writer_depth = 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer_depth -= 1
+                if self._writer_depth == 0:
+                    self._writer = None
+                    self._cond.notify_all()
+
 
 class NodeRegistry:
     """
@@ -44,7 +121,8 @@ class NodeRegistry:
     - Capability-based node discovery (label selectors)
     - Automatic cleanup of dead nodes
 
-    Thread-safe implementation using locks.
+    Thread-safe implementation using a reader-writer lock: discovery
+    queries run concurrently, mutations are exclusive.
     """
 
     def __init__(self, config_path: Optional[str] = None):
@@ -60,16 +138,29 @@ class NodeRegistry:
 
         # Registry storage: node_id -> RegistryEntry
         self._nodes: Dict[str, RegistryEntry] = {}
-        self._lock = threading.RLock()
+        self._lock = ReadWriteLock()
+
+        # Heartbeat slots: node_id -> time.monotonic_ns() of last heartbeat.
+        # Written without the lock (a dict store is atomic under the GIL).
+        self._last_seen_ns: Dict[str, int] = {}
+        # Slot value last copied into the datetime fields (see _materialize)
+        self._materialized_ns: Dict[str, int] = {}
+
+        # Immutable view of _nodes.values(); reset on membership changes
+        self._entries: Optional[Tuple[RegistryEntry, ...]] = None
 
         # Cleanup thread
         self._cleanup_thread: Optional[threading.Thread] = None
         self._stop_cleanup = threading.Event()
+        # Wakes the cleanup thread early (new registration or stop)
+        self._cleanup_cond = threading.Condition()
+        self._cleanup_wakeup = False
 
-        # Event callbacks
-        self._on_node_registered: List[Callable[[NodePassport], None]] = []
-        self._on_node_deregistered: List[Callable[[str, str], None]] = []
-        self._on_node_unhealthy: List[Callable[[str], None]] = []
+        # Event callbacks (tuples, replaced wholesale on subscribe so
+        # fire sites can iterate without copying or locking)
+        self._on_node_registered: Tuple[Callable[[NodePassport], None], ...] = ()
+        self._on_node_deregistered: Tuple[Callable[[str, str], None], ...] = ()
+        self._on_node_unhealthy: Tuple[Callable[[str], None], ...] = ()
 
         logger.info(
             f"NodeRegistry initialized: "
@@ -93,11 +184,10 @@ class NodeRegistry:
 
         if config_path and Path(config_path).exists():
             try:
-                with open(config_path) as f:
-                    file_config = yaml.safe_load(f)
-                    if file_config and "registry" in file_config:
-                        defaults.update(file_config["registry"])
-                        logger.info(f"Loaded config from {config_path}")
+                file_config = load_yaml_file(config_path) or {}
+                if "registry" in file_config:
+                    defaults.update(file_config["registry"])
+                    logger.info(f"Loaded config from {config_path}")
             except Exception as e:
                 logger.warning(f"Failed to load config from {config_path}: {e}")
 
@@ -123,7 +213,7 @@ class NodeRegistry:
         node_id = passport.metadata.uid
         node_name = passport.metadata.name
 
-        with self._lock:
+        with self._lock.write_lock():
             # Check for duplicate UID
             if node_id in self._nodes:
                 raise ValueError(f"Node with UID {node_id} already registered")
@@ -134,29 +224,39 @@ class NodeRegistry:
                     raise ValueError(f"Node with name '{node_name}' already registered")
 
             # Create registry entry
+            now = datetime.utcnow()
             entry = RegistryEntry(
                 node_id=node_id,
                 node_type=passport.metadata.node_type,
                 passport=passport,
-                last_seen=datetime.utcnow(),
+                last_seen=now,
                 health_state=HealthState.ALIVE,
-                registered_at=datetime.utcnow(),
+                registered_at=now,
             )
 
             self._nodes[node_id] = entry
-
-            logger.info(
-                f"Node registered: {node_name} (uid={node_id[:8]}..., "
-                f"type={passport.metadata.node_type.value}, "
-                f"capabilities={[c.name for c in passport.spec.capabilities]})"
-            )
+            self._entries = None
+            self._last_seen_ns[node_id] = time.monotonic_ns()
+            self._materialized_ns.pop(node_id, None)
+
+            # New node may have the earliest deadline
+            self._wake_cleanup()
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Node registered: %s (uid=%s..., type=%s, capabilities=%s)",
+                    node_name,
+                    node_id[:8],
+                    passport.metadata.node_type.value,
+                    [c.name for c in passport.spec.capabilities],
+                )
 
         # Fire callbacks
         for callback in self._on_node_registered:
             try:
                 callback(passport)
-            except Exception as e:
-                logger.error(f"Error in on_node_registered callback: {e}")
+            except Exception:
+                logger.exception("Error in on_node_registered callback")
 
         return node_id
 
@@ -171,12 +271,15 @@ class NodeRegistry:
         Returns:
             True if node was removed, False if not found.
         """
-        with self._lock:
+        with self._lock.write_lock():
             if node_id not in self._nodes:
                 logger.warning(f"Cannot deregister: node {node_id} not found")
                 return False
 
             entry = self._nodes.pop(node_id)
+            self._entries = None
+            self._last_seen_ns.pop(node_id, None)
+            self._materialized_ns.pop(node_id, None)
             node_name = entry.passport.metadata.name
 
             logger.info(f"Node deregistered: {node_name} (reason={reason})")
@@ -185,8 +288,8 @@ class NodeRegistry:
         for callback in self._on_node_deregistered:
             try:
                 callback(node_id, reason)
-            except Exception as e:
-                logger.error(f"Error in on_node_deregistered callback: {e}")
+            except Exception:
+                logger.exception("Error in on_node_deregistered callback")
 
         return True
 
@@ -198,31 +301,91 @@ class NodeRegistry:
         """
         Update heartbeat (last_seen) for a node.
 
+        Lock-free: stores a monotonic timestamp in the node's slot. The
+        datetime fields (entry.last_seen, lease.renew_time) are materialized
+        when the passport is read out of the registry.
+
         Args:
             node_id: UID of the node.
 
         Returns:
             True if updated, False if node not found.
         """
-        with self._lock:
-            if node_id not in self._nodes:
-                logger.warning(f"Heartbeat for unknown node: {node_id}")
-                return False
+        return self._touch(node_id, time.monotonic_ns())
+
+    def update_heartbeats(self, seen: Dict[str, int]) -> int:
+        """
+        Apply a batch of heartbeats.
+
+        Args:
+            seen: node_id -> time.monotonic_ns() when the heartbeat arrived.
 
-            entry = self._nodes[node_id]
-            entry.last_seen = datetime.utcnow()
+        Returns:
+            Number of nodes updated (unknown nodes are skipped).
+        """
+        touch = self._touch
+        return sum(1 for node_id, seen_ns in seen.items() if touch(node_id, seen_ns))
+
+    def _touch(self, node_id: str, seen_ns: int) -> bool:
+        """Store a heartbeat timestamp in the node's slot (no lock)."""
+        if node_id not in self._last_seen_ns:
+            logger.warning(f"Heartbeat for unknown node: {node_id}")
+            return False
+
+        self._last_seen_ns[node_id] = seen_ns
+
+        entry = self._nodes.get(node_id)
+        if entry is None:
+            return False
+        if entry.health_state != HealthState.ALIVE:
             entry.health_state = HealthState.ALIVE
 
-            # Also update lease in passport
-            entry.passport.status.lease.renew_time = datetime.utcnow()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Heartbeat updated: %s", entry.passport.metadata.name)
+        return True
 
-            logger.debug(f"Heartbeat updated: {entry.passport.metadata.name}")
-            return True
+    def _materialize(self, entry: RegistryEntry) -> NodePassport:
+        """
+        Sync last_seen / lease.renew_time from the monotonic slot.
+
+        The datetime is only rebuilt when a heartbeat arrived since the
+        last read, so repeated queries stay on integer compares. The
+        shared entry is updated under the write lock; callers must not
+        hold the read lock.
+        """
+        node_id = entry.node_id
+        last_seen_ns = self._last_seen_ns
+        materialized_ns = self._materialized_ns
+        if materialized_ns.get(node_id) == last_seen_ns.get(node_id, -1):
+            return entry.passport
+
+        with self._lock.write_lock():
+            seen_ns = last_seen_ns.get(node_id)
+            if seen_ns is not None and materialized_ns.get(node_id) != seen_ns:
+                elapsed_us = (time.monotonic_ns() - seen_ns) // 1000
+                last_seen = datetime.utcnow() - timedelta(microseconds=elapsed_us)
+                entry.last_seen = last_seen
+                entry.passport.status.lease.renew_time = last_seen
+                materialized_ns[node_id] = seen_ns
+        return entry.passport
 
     # =========================================================================
     # Query / Discovery
     # =========================================================================
 
+    def _snapshot(self) -> Tuple[RegistryEntry, ...]:
+        """
+        Get the current entries as a tuple, holding the lock only to fetch it.
+
+        The tuple is rebuilt only after registration/removal, so list-style
+        queries filter and materialize outside the critical section.
+        """
+        with self._lock.read_lock():
+            entries = self._entries
+            if entries is None:
+                entries = self._entries = tuple(self._nodes.values())
+            return entries
+
     def get_node(self, node_id: str) -> Optional[NodePassport]:
         """
         Get a node by its UID.
@@ -233,9 +396,9 @@ class NodeRegistry:
         Returns:
             NodePassport if found, None otherwise.
         """
-        with self._lock:
+        with self._lock.read_lock():
             entry = self._nodes.get(node_id)
-            return entry.passport if entry else None
+        return self._materialize(entry) if entry else None
 
     def get_node_by_name(self, name: str) -> Optional[NodePassport]:
         """
@@ -247,11 +410,12 @@ class NodeRegistry:
         Returns:
             NodePassport if found, None otherwise.
         """
-        with self._lock:
-            for entry in self._nodes.values():
-                if entry.passport.metadata.name == name:
-                    return entry.passport
-            return None
+        with self._lock.read_lock():
+            entry = next(
+                (e for e in self._nodes.values() if e.passport.metadata.name == name),
+                None,
+            )
+        return self._materialize(entry) if entry else None
 
     def get_all_nodes(self) -> List[NodePassport]:
         """
@@ -260,8 +424,7 @@ class NodeRegistry:
         Returns:
             List of all NodePassports.
         """
-        with self._lock:
-            return [entry.passport for entry in self._nodes.values()]
+        return [self._materialize(entry) for entry in self._snapshot()]
 
     def get_alive_nodes(self) -> List[NodePassport]:
         """
@@ -270,12 +433,11 @@ class NodeRegistry:
         Returns:
             List of alive NodePassports.
         """
-        with self._lock:
-            return [
-                entry.passport
-                for entry in self._nodes.values()
-                if entry.health_state == HealthState.ALIVE
-            ]
+        return [
+            self._materialize(entry)
+            for entry in self._snapshot()
+            if entry.health_state == HealthState.ALIVE
+        ]
 
     def find_nodes(
         self,
@@ -296,31 +458,32 @@ class NodeRegistry:
         Returns:
             List of matching NodePassports.
         """
-        with self._lock:
-            results = []
+        alive = HealthState.ALIVE
+        materialize = self._materialize
+        results = []
 
-            for entry in self._nodes.values():
-                passport = entry.passport
+        for entry in self._snapshot():
+            # Filter by health
+            if only_healthy and entry.health_state != alive:
+                continue
 
-                # Filter by health
-                if only_healthy and entry.health_state != HealthState.ALIVE:
-                    continue
+            passport = entry.passport
 
-                # Filter by node type
-                if node_type and passport.metadata.node_type != node_type:
-                    continue
+            # Filter by node type
+            if node_type and entry.node_type != node_type:
+                continue
 
-                # Filter by capability
-                if capability and not passport.has_capability(capability):
-                    continue
+            # Filter by capability
+            if capability and not passport.has_capability(capability):
+                continue
 
-                # Filter by label selector
-                if selector and not passport.matches_labels(selector):
-                    continue
+            # Filter by label selector
+            if selector and not passport.matches_labels(selector):
+                continue
 
-                results.append(passport)
+            results.append(materialize(entry))
 
-            return results
+        return results
 
     def find_nodes_by_capability(
         self,
@@ -352,43 +515,65 @@ class NodeRegistry:
         Returns:
             List of removed node IDs.
         """
-        ttl = timedelta(seconds=self.config["ttl_seconds"])
-        now = datetime.utcnow()
+        ttl_ns = int(self.config["ttl_seconds"] * 1_000_000_000)
+        half_ttl_ns = ttl_ns // 2
+        alive = HealthState.ALIVE
+        not_ready = HealthState.NOT_READY
+        warn = logger.isEnabledFor(logging.WARNING)
         removed = []
 
-        with self._lock:
+        with self._lock.write_lock():
             dead_nodes = []
+            get_seen_ns = self._last_seen_ns.get
+            now_ns = time.monotonic_ns()
 
             for node_id, entry in self._nodes.items():
-                time_since_heartbeat = now - entry.last_seen
+                elapsed_ns = now_ns - get_seen_ns(node_id, now_ns)
 
-                if time_since_heartbeat > ttl:
+                if elapsed_ns > ttl_ns:
                     dead_nodes.append(node_id)
-                    logger.warning(
-                        f"Node TTL expired: {entry.passport.metadata.name} "
-                        f"(last_seen={entry.last_seen.isoformat()}, "
-                        f"elapsed={time_since_heartbeat.total_seconds():.1f}s)"
-                    )
-                elif time_since_heartbeat > ttl / 2:
-                    # Mark as NOT_READY if more than half TTL elapsed
-                    if entry.health_state == HealthState.ALIVE:
-                        entry.health_state = HealthState.NOT_READY
+                    if warn:
+                        self._materialize(entry)
                         logger.warning(
-                            f"Node becoming unhealthy: {entry.passport.metadata.name}"
+                            f"Node TTL expired: {entry.passport.metadata.name} "
+                            f"(last_seen={entry.last_seen.isoformat()}, "
+                            f"elapsed={elapsed_ns / 1e9:.1f}s)"
                         )
+                elif elapsed_ns > half_ttl_ns:
+                    # Mark as NOT_READY if more than half TTL elapsed
+                    if entry.health_state == alive:
+                        entry.health_state = not_ready
+                        if warn:
+                            logger.warning(
+                                f"Node becoming unhealthy: {entry.passport.metadata.name}"
+                            )
+                elif entry.health_state == not_ready:
+                    # Heartbeat raced with a previous pass; restore liveness
+                    entry.health_state = alive
+
+            # Drop heartbeat slots left behind by a heartbeat racing a removal
+            for node_id in list(self._last_seen_ns.keys() - self._nodes.keys()):
+                self._last_seen_ns.pop(node_id, None)
+                self._materialized_ns.pop(node_id, None)
 
             # Remove dead nodes
             for node_id in dead_nodes:
                 entry = self._nodes.pop(node_id)
+                self._entries = None
+                self._last_seen_ns.pop(node_id, None)
+                self._materialized_ns.pop(node_id, None)
                 entry.health_state = HealthState.OFFLINE
                 removed.append(node_id)
 
-                # Fire unhealthy callback
-                for callback in self._on_node_unhealthy:
-                    try:
-                        callback(node_id)
-                    except Exception as e:
-                        logger.error(f"Error in on_node_unhealthy callback: {e}")
+            callbacks = self._on_node_unhealthy
+
+        # Fire unhealthy callbacks outside the lock
+        for node_id in removed:
+            for callback in callbacks:
+                try:
+                    callback(node_id)
+                except Exception:
+                    logger.exception("Error in on_node_unhealthy callback")
 
         return removed
 
@@ -401,10 +586,36 @@ class NodeRegistry:
         self._stop_cleanup.clear()
 
         def cleanup_loop():
-            interval = self.config["cleanup_interval_seconds"]
-            logger.info(f"Cleanup thread started (interval={interval}s)")
+            logger.info(
+                f"Cleanup thread started "
+                f"(min interval={self.config['cleanup_interval_seconds']}s)"
+            )
+
+            while True:
+                # Sleep until the next health transition is due, but no more
+                # often than cleanup_interval_seconds
+                delay = self._next_cleanup_delay()
+                if delay is None:
+                    delay = IDLE_CLEANUP_WAIT_SECONDS
+                else:
+                    delay = max(delay, self.config["cleanup_interval_seconds"])
+
+                with self._cleanup_cond:
+                    timed_out = False
+                    if not self._cleanup_wakeup and not self._stop_cleanup.is_set():
+                        timed_out = not self._cleanup_cond.wait(timeout=delay)
+                    self._cleanup_wakeup = False
+
+                if self._stop_cleanup.is_set():
+                    break
+
+                if not timed_out:
+                    # Woken early (e.g. by a registration): recompute the
+                    # deadline and scan only if a transition is due now
+                    delay = self._next_cleanup_delay()
+                    if delay is None or delay > 0:
+                        continue
 
-            while not self._stop_cleanup.wait(timeout=interval):
                 try:
                     removed = self.remove_dead_nodes()
                     if removed:
@@ -420,25 +631,57 @@ class NodeRegistry:
     def stop_cleanup_thread(self):
         """Stop the cleanup thread."""
         self._stop_cleanup.set()
+        self._wake_cleanup()
         if self._cleanup_thread:
             self._cleanup_thread.join(timeout=5.0)
             self._cleanup_thread = None
 
+    def _wake_cleanup(self) -> None:
+        """Make the cleanup thread re-check deadlines now."""
+        with self._cleanup_cond:
+            self._cleanup_wakeup = True
+            self._cleanup_cond.notify()
+
+    def _next_cleanup_delay(self) -> Optional[float]:
+        """
+        Seconds until the earliest node crosses half-TTL or TTL.
+
+        Heartbeats only push deadlines later, so waking at this time never
+        misses a transition. Returns None if the registry is empty.
+        """
+        ttl_ns = int(self.config["ttl_seconds"] * 1_000_000_000)
+        half_ttl_ns = ttl_ns // 2
+        alive = HealthState.ALIVE
+        now_ns = time.monotonic_ns()
+        earliest = None
+
+        with self._lock.read_lock():
+            get_seen_ns = self._last_seen_ns.get
+            for node_id, entry in self._nodes.items():
+                seen_ns = get_seen_ns(node_id, now_ns)
+                deadline = seen_ns + (half_ttl_ns if entry.health_state == alive else ttl_ns)
+                if earliest is None or deadline < earliest:
+                    earliest = deadline
+
+        if earliest is None:
+            return None
+        return max(0, earliest - now_ns) / 1e9
+
     # =========================================================================
     # Event callbacks
     # =========================================================================
 
     def on_node_registered(self, callback: Callable[[NodePassport], None]):
         """Register callback for node registration events."""
-        self._on_node_registered.append(callback)
+        self._on_node_registered = (*self._on_node_registered, callback)
 
     def on_node_deregistered(self, callback: Callable[[str, str], None]):
         """Register callback for node deregistration events."""
-        self._on_node_deregistered.append(callback)
+        self._on_node_deregistered = (*self._on_node_deregistered, callback)
 
     def on_node_unhealthy(self, callback: Callable[[str], None]):
         """Register callback for node unhealthy events."""
-        self._on_node_unhealthy.append(callback)
+        self._on_node_unhealthy = (*self._on_node_unhealthy, callback)
 
     # =========================================================================
     # Statistics
@@ -451,7 +694,7 @@ class NodeRegistry:
         Returns:
             Dict with statistics.
         """
-        with self._lock:
+        with self._lock.read_lock():
             total = len(self._nodes)
             alive = sum(1 for e in self._nodes.values() if e.health_state == HealthState.ALIVE)
             not_ready = sum(1 for e in self._nodes.values() if e.health_state == HealthState.NOT_READY)
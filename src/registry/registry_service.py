@@ -12,18 +12,19 @@ See: docs/SSOT/NODE_REGISTRY_SPEC_v1.0.md
 """
 
 import logging
+import queue
 import signal
 import threading
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-import yaml
-
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.mindbus.core import MindBus
+from src.yaml_config import load_yaml_file
 from src.registry.node_registry import NodeRegistry
 from src.registry.models import NodePassport
 
@@ -54,6 +55,11 @@ class RegistryService:
         self._running = False
         self._start_time: Optional[datetime] = None
 
+        # Heartbeats received from MindBus, applied in batches off the
+        # consumer thread: (node_id, monotonic_ns) or None to stop
+        self._heartbeat_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._heartbeat_thread: Optional[threading.Thread] = None
+
         # Statistics
         self._events_processed = 0
         self._registrations = 0
@@ -74,10 +80,8 @@ class RegistryService:
 
         if Path(config_path).exists():
             try:
-                with open(config_path) as f:
-                    file_config = yaml.safe_load(f)
-                    if file_config:
-                        defaults.update(file_config.get("service", {}))
+                file_config = load_yaml_file(config_path) or {}
+                defaults.update(file_config.get("service", {}))
             except Exception as e:
                 logger.warning(f"Failed to load config: {e}")
 
@@ -112,8 +116,9 @@ class RegistryService:
                 node_id = self.registry.register_node(passport)
                 self._registrations += 1
                 logger.info(
-                    f"Node registered via event: {passport.metadata.name} "
-                    f"(uid={node_id[:8]}...)"
+                    "Node registered via event: %s (uid=%s...)",
+                    passport.metadata.name,
+                    node_id[:8],
                 )
             except ValueError as e:
                 # Node already registered - update instead
@@ -122,33 +127,65 @@ class RegistryService:
         except Exception as e:
             logger.error(f"Error processing node.registered event: {e}")
 
-    def _on_node_heartbeat(self, event: dict, data: dict) -> None:
+    def _enqueue_heartbeat(self, event: dict, data: dict) -> None:
         """
-        Handle node.heartbeat event.
+        MindBus handler for node.heartbeat: queue it for the drain thread.
 
-        Expected data:
-            - node_id: Node UID
-            - name: Node name (for logging)
-            - renew_time: ISO timestamp
+        Keeps the consumer thread free during heartbeat storms. Registrations
+        and deregistrations stay inline so their order is preserved.
         """
         self._events_processed += 1
 
-        try:
-            node_id = data.get("node_id")
-            if not node_id:
-                logger.warning("node.heartbeat event missing node_id")
+        node_id = data.get("node_id")
+        if not node_id:
+            logger.warning("node.heartbeat event missing node_id")
+            return
+
+        self._heartbeat_queue.put((node_id, time.monotonic_ns()))
+
+    def _drain_heartbeats(self) -> None:
+        """Apply queued heartbeats in batches, coalescing repeats per node."""
+        q = self._heartbeat_queue
+
+        while True:
+            item = q.get()
+            if item is None:
                 return
 
-            # Update heartbeat in registry
-            if self.registry.update_heartbeat(node_id):
-                self._heartbeats += 1
-                logger.debug(f"Heartbeat updated for node {node_id[:8]}...")
-            else:
-                # Node not in registry - might have been cleaned up
-                logger.warning(f"Heartbeat for unknown node: {node_id[:8]}...")
+            # Batch whatever queued up meanwhile; an isolated heartbeat is
+            # applied right away
+            node_id, seen_ns = item
+            seen = {node_id: seen_ns}
+            get_nowait = q.get_nowait
+            stop = False
+            try:
+                while True:
+                    item = get_nowait()
+                    if item is None:
+                        stop = True
+                        break
+                    node_id, seen_ns = item
+                    seen[node_id] = seen_ns
+            except queue.Empty:
+                pass
 
-        except Exception as e:
-            logger.error(f"Error processing node.heartbeat event: {e}")
+            try:
+                self._heartbeats += self.registry.update_heartbeats(seen)
+            except Exception as e:
+                logger.error(f"Error applying heartbeat batch: {e}")
+
+            if stop:
+                return
+
+    def _start_heartbeat_thread(self) -> None:
+        """Start the thread applying queued heartbeats (see _enqueue_heartbeat)."""
+        if self._heartbeat_thread is not None:
+            return
+
+        self._heartbeat_thread = threading.Thread(
+            target=self._drain_heartbeats, daemon=True
+        )
+        self._heartbeat_thread.start()
 
     def _on_node_deregistered(self, event: dict, data: dict) -> None:
         """
@@ -162,8 +199,9 @@ class RegistryService:
         self._events_processed += 1
 
         try:
-            node_id = data.get("node_id")
-            reason = data.get("reason", "Unknown")
+            get = data.get
+            node_id = get("node_id")
+            reason = get("reason", "Unknown")
 
             if not node_id:
                 logger.warning("node.deregistered event missing node_id")
@@ -173,7 +211,7 @@ class RegistryService:
             if self.registry.deregister_node(node_id, reason):
                 self._deregistrations += 1
                 logger.info(
-                    f"Node deregistered via event: {data.get('name', 'unknown')} "
+                    f"Node deregistered via event: {get('name', 'unknown')} "
                     f"(reason={reason})"
                 )
             else:
@@ -208,10 +246,13 @@ class RegistryService:
         # Subscribe to node events
         # Pattern: evt.node.* (all node-related events)
         self.bus.subscribe("evt.node.registered", self._on_node_registered)
-        self.bus.subscribe("evt.node.heartbeat", self._on_node_heartbeat)
+        self.bus.subscribe("evt.node.heartbeat", self._enqueue_heartbeat)
         self.bus.subscribe("evt.node.deregistered", self._on_node_deregistered)
         print("   ✓ Subscribed to evt.node.* events")
 
+        # Start heartbeat batching thread
+        self._start_heartbeat_thread()
+
         # Start registry cleanup thread
         self.registry.start_cleanup_thread()
         print("   ✓ Started cleanup thread")
@@ -238,6 +279,12 @@ class RegistryService:
         # Stop cleanup thread
         self.registry.stop_cleanup_thread()
 
+        # Flush pending heartbeats and stop the drain thread
+        if self._heartbeat_thread:
+            self._heartbeat_queue.put(None)
+            self._heartbeat_thread.join(timeout=5.0)
+            self._heartbeat_thread = None
+
         # Disconnect from MindBus
         try:
             self.bus.stop_consuming()
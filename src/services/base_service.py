@@ -15,6 +15,9 @@ This class handles:
 See: docs/project/IMPLEMENTATION_ROADMAP.md Step 2.0.1
 """
 
+import copy
+import heapq
+import itertools
 import logging
 import signal
 import threading
@@ -23,14 +26,13 @@ import uuid
 from abc import ABC, abstractmethod
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
-import yaml
+from typing import Any, Callable, Dict, List, Optional
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.mindbus.core import MindBus
+from src.yaml_config import load_yaml_file
 from src.registry.models import (
     NodePassport,
     NodeMetadata,
@@ -48,6 +50,103 @@ from src.registry.models import (
 logger = logging.getLogger(__name__)
 
 
+class _HeartbeatScheduler:
+    """
+    One daemon thread sending heartbeats for every service in the process.
+
+    Services register a callback and an interval; the thread sleeps on a
+    Condition until the earliest deadline in a min-heap, so N services
+    cost one thread and one wake-up per due deadline instead of N threads.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        # (deadline, seq, key, token); entries whose token no longer matches
+        # self._entries[key] are stale and skipped lazily
+        self._heap: List[tuple] = []
+        self._entries: Dict[Any, tuple] = {}  # key -> (interval, callback, token)
+        self._running_keys: set = set()
+        self._seq = itertools.count()
+        self._thread: Optional[threading.Thread] = None
+
+    def register(self, key: Any, interval: float, callback: Callable[[], None]) -> None:
+        """Call callback every interval seconds until unregister(key)."""
+        with self._cond:
+            token = next(self._seq)
+            self._entries[key] = (interval, callback, token)
+            heapq.heappush(self._heap, (time.monotonic() + interval, token, key, token))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="heartbeat-scheduler", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify_all()
+
+    def unregister(self, key: Any) -> None:
+        """Stop calling key's callback; waits for an in-flight call to finish."""
+        with self._cond:
+            self._entries.pop(key, None)
+            if threading.current_thread() is not self._thread:
+                while key in self._running_keys:
+                    self._cond.wait()
+            self._cond.notify_all()
+
+    def _is_current(self, key: Any, token: int) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and entry[2] == token
+
+    def _run(self) -> None:
+        heap = self._heap
+        while True:
+            with self._cond:
+                while True:
+                    # Drop entries of unregistered/re-registered keys
+                    while heap and not self._is_current(heap[0][2], heap[0][3]):
+                        heapq.heappop(heap)
+                    if not heap:
+                        self._cond.wait()
+                        continue
+                    delay = heap[0][0] - time.monotonic()
+                    if delay <= 0:
+                        break
+                    self._cond.wait(timeout=delay)
+
+                deadline, _, key, token = heapq.heappop(heap)
+                interval, callback, _ = self._entries[key]
+                self._running_keys.add(key)
+
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"[{getattr(key, 'name', key)}] Error sending heartbeat: {e}")
+
+            with self._cond:
+                self._running_keys.discard(key)
+                if self._is_current(key, token):
+                    # Keep the cadence, but don't burst after a stall
+                    deadline = max(deadline + interval, time.monotonic())
+                    heapq.heappush(heap, (deadline, next(self._seq), key, token))
+                self._cond.notify_all()
+
+
+_heartbeat_scheduler = _HeartbeatScheduler()
+
+# Exception class -> google.rpc.Code (exact type match)
+_ERROR_CODE_BY_TYPE: Dict[type, str] = {
+    ValueError: "INVALID_ARGUMENT",
+    TypeError: "INVALID_ARGUMENT",
+    KeyError: "NOT_FOUND",
+    FileNotFoundError: "NOT_FOUND",
+    PermissionError: "PERMISSION_DENIED",
+    TimeoutError: "DEADLINE_EXCEEDED",
+    ConnectionError: "UNAVAILABLE",
+    NotImplementedError: "UNIMPLEMENTED",
+}
+
+# Exception classes reported as retryable (exact type match)
+_RETRYABLE_TYPES = frozenset({TimeoutError, ConnectionError, OSError})
+
+
 class BaseService(ABC):
     """
     Abstract base class for AI_TEAM infrastructure services.
@@ -71,6 +170,10 @@ class BaseService(ABC):
         self.service_type = self.config.get("type", "service")
         self.capabilities = self.config.get("capabilities", [])
 
+        # Command routing, shared by start() and the passport endpoint
+        self._safe_name = self.name.replace(".", "_")
+        self._routing_pattern = f"cmd.{self._safe_name}.*"
+
         # Registry configuration (from config or defaults)
         registry_config = self.config.get("registry", {})
         self._heartbeat_interval = registry_config.get("heartbeat_interval_seconds", 10)
@@ -84,13 +187,20 @@ class BaseService(ABC):
         # Registration state
         self._node_uid: Optional[str] = None
         self._passport: Optional[NodePassport] = None
-        self._heartbeat_thread: Optional[threading.Thread] = None
-        self._stop_heartbeat = threading.Event()
+        self._registration_data: Optional[dict] = None
+        # Heartbeat payload; only renew_time/total_tasks_processed change per beat
+        self._heartbeat_template: dict = {
+            "node_id": None,
+            "name": self.name,
+            "renew_time": None,
+            "current_tasks": 0,
+            "total_tasks_processed": 0,
+        }
 
     def _load_config(self, config_path: str) -> dict:
         """Load service configuration from YAML file."""
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
+        # Deep copy: callers may mutate self.config, the cached parse is shared
+        config = copy.deepcopy(load_yaml_file(config_path, sidecar=True))
         # Extract service-specific config (file may have nested structure)
         if len(config) == 1:
             return list(config.values())[0]
@@ -134,7 +244,7 @@ class BaseService(ABC):
         """
         Handle incoming COMMAND message from MindBus.
         """
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
 
         action = data.get("action", "unknown")
         params = data.get("params", {})
@@ -150,7 +260,7 @@ class BaseService(ABC):
         try:
             result = self.handle_command(action, params, context)
 
-            execution_time_ms = int((time.time() - start_time) * 1000)
+            execution_time_ms = (time.monotonic_ns() - start_ns) // 1_000_000
 
             self.bus.send_result(
                 output=result,
@@ -166,7 +276,7 @@ class BaseService(ABC):
             logger.info(f"[{self.name}] Sent RESULT for action={action} ({execution_time_ms}ms)")
 
         except Exception as e:
-            execution_time_ms = int((time.time() - start_time) * 1000)
+            execution_time_ms = (time.monotonic_ns() - start_ns) // 1_000_000
 
             error_code = self._get_error_code(e)
             retryable = self._is_retryable(e)
@@ -187,22 +297,11 @@ class BaseService(ABC):
 
     def _get_error_code(self, error: Exception) -> str:
         """Map exception to google.rpc.Code."""
-        mapping = {
-            "ValueError": "INVALID_ARGUMENT",
-            "TypeError": "INVALID_ARGUMENT",
-            "KeyError": "NOT_FOUND",
-            "FileNotFoundError": "NOT_FOUND",
-            "PermissionError": "PERMISSION_DENIED",
-            "TimeoutError": "DEADLINE_EXCEEDED",
-            "ConnectionError": "UNAVAILABLE",
-            "NotImplementedError": "UNIMPLEMENTED",
-        }
-        return mapping.get(type(error).__name__, "INTERNAL")
+        return _ERROR_CODE_BY_TYPE.get(type(error), "INTERNAL")
 
     def _is_retryable(self, error: Exception) -> bool:
         """Determine if error is retryable."""
-        retryable_types = {"TimeoutError", "ConnectionError", "OSError"}
-        return type(error).__name__ in retryable_types
+        return type(error) in _RETRYABLE_TYPES
 
     def _get_metrics(self) -> Dict[str, Any]:
         """Get service metrics for response."""
@@ -248,7 +347,7 @@ class BaseService(ABC):
         if protocol == "amqp":
             endpoint = Endpoint(
                 protocol="amqp",
-                queue=f"cmd.{self.name.replace('.', '_')}.*",
+                queue=self._routing_pattern,
             )
         else:
             endpoint = Endpoint(
@@ -297,18 +396,34 @@ class BaseService(ABC):
         if not self._enable_registration:
             return
 
-        passport = self._build_passport()
-
-        self.bus.send_event(
-            event_type_name="node.registered",
-            event_data={
+        # Metadata and spec are built and serialized once; the status part
+        # is dumped per send so re-registration reports the current state
+        if self._registration_data is None:
+            passport = self._build_passport()
+            self._registration_data = {
                 "node_id": passport.metadata.uid,
                 "name": passport.metadata.name,
                 "node_type": passport.metadata.node_type.value,
                 "capabilities": [cap.name for cap in passport.spec.capabilities],
                 "labels": passport.metadata.labels,
-                "passport": passport.model_dump(mode="json"),
-            },
+                "passport": passport.model_dump(mode="json", exclude={"status"}),
+            }
+            self._heartbeat_template["node_id"] = self._node_uid
+            self._heartbeat_template["current_tasks"] = passport.status.current_tasks
+
+        status = self._passport.status
+        status.lease.renew_time = datetime.utcnow()
+        status.total_tasks_processed = self._requests_processed
+
+        event_data = self._registration_data.copy()
+        event_data["passport"] = {
+            **event_data["passport"],
+            "status": status.model_dump(mode="json"),
+        }
+
+        self.bus.send_event(
+            event_type_name="node.registered",
+            event_data=event_data,
             source=self.name,
             tags=["registration", "node", "service"],
         )
@@ -320,18 +435,20 @@ class BaseService(ABC):
         if not self._enable_registration or self._passport is None:
             return
 
-        self._passport.status.lease.renew_time = datetime.utcnow()
-        self._passport.status.total_tasks_processed = self._requests_processed
+        # Keep get_passport() current; the payload itself is a plain dict
+        # copied from the template, not a Pydantic dump
+        now = datetime.utcnow()
+        status = self._passport.status
+        status.lease.renew_time = now
+        status.total_tasks_processed = self._requests_processed
+
+        event_data = self._heartbeat_template.copy()
+        event_data["renew_time"] = now.isoformat()
+        event_data["total_tasks_processed"] = self._requests_processed
 
         self.bus.send_event(
             event_type_name="node.heartbeat",
-            event_data={
-                "node_id": self._node_uid,
-                "name": self.name,
-                "renew_time": self._passport.status.lease.renew_time.isoformat(),
-                "current_tasks": self._passport.status.current_tasks,
-                "total_tasks_processed": self._requests_processed,
-            },
+            event_data=event_data,
             source=self.name,
             tags=["heartbeat", "node", "service"],
         )
@@ -358,32 +475,18 @@ class BaseService(ABC):
         logger.info(f"[{self.name}] Sent node.deregistered event (reason={reason})")
 
     def _start_heartbeat_thread(self) -> None:
-        """Start background thread for sending heartbeats."""
+        """Schedule heartbeats on the process-wide heartbeat thread."""
         if not self._enable_registration:
             return
 
-        self._stop_heartbeat.clear()
-
-        def heartbeat_loop():
-            logger.info(f"[{self.name}] Heartbeat thread started (interval={self._heartbeat_interval}s)")
-
-            while not self._stop_heartbeat.wait(timeout=self._heartbeat_interval):
-                try:
-                    self._send_heartbeat_event()
-                except Exception as e:
-                    logger.error(f"[{self.name}] Error sending heartbeat: {e}")
-
-            logger.info(f"[{self.name}] Heartbeat thread stopped")
-
-        self._heartbeat_thread = threading.Thread(target=heartbeat_loop, daemon=True)
-        self._heartbeat_thread.start()
+        _heartbeat_scheduler.register(
+            self, self._heartbeat_interval, self._send_heartbeat_event
+        )
+        logger.info(f"[{self.name}] Heartbeat scheduled (interval={self._heartbeat_interval}s)")
 
     def _stop_heartbeat_thread(self) -> None:
-        """Stop the heartbeat thread."""
-        self._stop_heartbeat.set()
-        if self._heartbeat_thread:
-            self._heartbeat_thread.join(timeout=2.0)
-            self._heartbeat_thread = None
+        """Stop sending heartbeats for this service."""
+        _heartbeat_scheduler.unregister(self)
 
     def get_passport(self) -> Optional[NodePassport]:
         """Get current NODE_PASSPORT."""
@@ -411,16 +514,13 @@ class BaseService(ABC):
 
         self._setup_signal_handlers()
 
-        # Subscribe to commands for this service
-        routing_pattern = f"cmd.{self.name.replace('.', '_')}.*"
-        self.bus.subscribe(routing_pattern, self._on_command)
-        print(f"   ✓ Subscribed to: {routing_pattern}")
-
-        # Also subscribe to service-type commands
+        # Subscribe to commands for this service and its service type:
+        # one queue bound to both patterns, so one consumer serves both
+        routing_pattern = self._routing_pattern
         type_pattern = f"cmd.{self.service_type}.*"
-        if type_pattern != routing_pattern:
-            self.bus.subscribe(type_pattern, self._on_command)
-            print(f"   ✓ Subscribed to: {type_pattern}")
+        extra_patterns = [type_pattern] if type_pattern != routing_pattern else []
+        self.bus.subscribe(routing_pattern, self._on_command, extra_patterns=extra_patterns)
+        print(f"   ✓ Subscribed to: {', '.join([routing_pattern, *extra_patterns])}")
 
         self._running = True
         self._start_time = datetime.now()
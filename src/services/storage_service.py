@@ -14,10 +14,14 @@ Capabilities: file_storage, artifact_storage
 See: docs/project/IMPLEMENTATION_ROADMAP.md Step 2.0.1
 """
 
+import base64
+import bisect
 import hashlib
 import logging
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -26,6 +30,95 @@ from src.registry.models import NodeType
 
 logger = logging.getLogger(__name__)
 
+# Content fingerprint algorithm (not a cryptographic commitment)
+HASH_ALGO = "sha256"
+
+# Artifact metadata fields indexed for list_artifacts filters
+ARTIFACT_INDEX_FIELDS = ("task_id", "process_id", "artifact_type")
+
+# (epoch milliseconds, formatted) of the last timestamp produced by _iso_now()
+_last_iso: tuple = (0, "")
+
+
+def _iso_now() -> str:
+    """
+    Current UTC time as a naive ISO-8601 string with millisecond precision.
+
+    Saves within the same millisecond share one preformatted string.
+    """
+    global _last_iso
+    now_ms = time.time_ns() // 1_000_000
+    cached_ms, cached = _last_iso
+    if now_ms == cached_ms:
+        return cached
+    formatted = (
+        datetime.fromtimestamp(now_ms / 1000, tz=timezone.utc)
+        .replace(tzinfo=None)
+        .isoformat(timespec="milliseconds")
+    )
+    _last_iso = (now_ms, formatted)
+    return formatted
+
+
+def _content_hash(content: bytes) -> str:
+    """Fingerprint content with HASH_ALGO."""
+    return hashlib.sha256(memoryview(content)).hexdigest()
+
+
+@dataclass(slots=True)
+class _FileRecord:
+    """Stored file; metadata dict is built only for responses."""
+
+    content: bytes
+    path: str
+    size_bytes: int
+    content_type: str
+    content_hash: Optional[str]  # None while background hashing is pending
+    hash_algo: str
+    created_at: str
+    updated_at: str
+    encoding: Optional[str] = None  # set when the file was saved as text
+
+    def metadata(self) -> Dict[str, Any]:
+        metadata = {
+            "path": self.path,
+            "size_bytes": self.size_bytes,
+            "content_type": self.content_type,
+            "content_hash": self.content_hash,
+            "hash_algo": self.hash_algo,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+        if self.encoding is not None:
+            metadata["encoding"] = self.encoding
+        return metadata
+
+
+def _fill_content_hash(record: _FileRecord) -> None:
+    """Background hashing task for a stored file."""
+    record.content_hash = _content_hash(record.content)
+
+
+@dataclass(slots=True)
+class _ArtifactRecord:
+    """Stored artifact; metadata dict is built only for responses."""
+
+    data: Any
+    artifact_id: str
+    task_id: Optional[str]
+    process_id: Optional[str]
+    artifact_type: str
+    created_at: str
+
+    def metadata(self) -> Dict[str, Any]:
+        return {
+            "artifact_id": self.artifact_id,
+            "task_id": self.task_id,
+            "process_id": self.process_id,
+            "artifact_type": self.artifact_type,
+            "created_at": self.created_at,
+        }
+
 
 class StorageService(BaseService):
     """
@@ -48,13 +141,43 @@ class StorageService(BaseService):
         super().__init__(config_path)
 
         # In-memory storage (TODO: replace with persistent backend)
-        self._files: Dict[str, Dict[str, Any]] = {}  # path -> {content, metadata}
-        self._artifacts: Dict[str, Dict[str, Any]] = {}  # artifact_id -> {data, metadata}
+        self._files: Dict[str, _FileRecord] = {}  # path -> record
+        self._artifacts: Dict[str, _ArtifactRecord] = {}  # artifact_id -> record
+        self._paths_sorted: List[str] = []  # keys of _files, sorted (prefix listing)
+        self._total_file_bytes = 0  # sum of size_bytes over _files
+
+        # Secondary artifact indexes: field -> value -> artifact ids
+        # (dicts used as insertion-ordered sets)
+        self._artifact_index: Dict[str, Dict[str, Dict[str, None]]] = {
+            field: {} for field in ARTIFACT_INDEX_FIELDS
+        }
 
         # Storage configuration
         storage_config = self.config.get("storage", {})
         self._max_file_size = storage_config.get("max_file_size_bytes", 10 * 1024 * 1024)  # 10MB default
         self._max_files = storage_config.get("max_files", 10000)
+        self._async_hash_min_bytes = storage_config.get("async_hash_min_bytes", 1024 * 1024)
+
+        # Large files are hashed here, off the MindBus consumer thread
+        # (hashlib releases the GIL while hashing)
+        self._hash_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="storage-hash"
+        )
+
+        # Action dispatch table (bound once, not per request)
+        self._handlers = {
+            "save_file": self._save_file,
+            "read_file": self._read_file,
+            "list_files": self._list_files,
+            "delete_file": self._delete_file,
+            "file_exists": self._file_exists,
+            "get_file_info": self._get_file_info,
+            "save_artifact": self._save_artifact,
+            "get_artifact": self._get_artifact,
+            "list_artifacts": self._list_artifacts,
+            "get_stats": self._get_storage_stats,
+        }
+        self._supported_actions = tuple(self._handlers)
 
         logger.info(
             f"StorageService initialized: max_file_size={self._max_file_size}, "
@@ -85,25 +208,20 @@ class StorageService(BaseService):
         """
         logger.info(f"Handling action: {action}")
 
-        handlers = {
-            "save_file": self._save_file,
-            "read_file": self._read_file,
-            "list_files": self._list_files,
-            "delete_file": self._delete_file,
-            "file_exists": self._file_exists,
-            "get_file_info": self._get_file_info,
-            "save_artifact": self._save_artifact,
-            "get_artifact": self._get_artifact,
-            "list_artifacts": self._list_artifacts,
-            "get_stats": self._get_storage_stats,
-        }
-
-        handler = handlers.get(action)
+        handler = self._handlers.get(action)
         if handler is None:
-            raise ValueError(f"Unknown action: {action}. Supported: {list(handlers.keys())}")
+            raise ValueError(f"Unknown action: {action}. Supported: {list(self._supported_actions)}")
 
         return handler(params)
 
+    def stop(self) -> None:
+        """Stop the service and its hashing thread."""
+        try:
+            super().stop()
+        finally:
+            # Pending background hashes are not waited for
+            self._hash_executor.shutdown(wait=False)
+
     # =========================================================================
     # File Operations
     # =========================================================================
@@ -117,6 +235,9 @@ class StorageService(BaseService):
             content: File content (string or bytes as base64)
             content_type: MIME type (optional)
             overwrite: Allow overwriting existing file (default: True)
+            content_hash: Precomputed content hash; skips hashing (optional)
+            hash_algo: Algorithm of content_hash (default: sha256)
+            sync_hash: Hash large files before replying (default: False)
         """
         path = params.get("path")
         content = params.get("content")
@@ -130,7 +251,10 @@ class StorageService(BaseService):
         if len(self._files) >= self._max_files and path not in self._files:
             raise ValueError(f"Storage limit reached: max {self._max_files} files")
 
-        content_size = len(content.encode("utf-8") if isinstance(content, str) else content)
+        # Store bytes only: encoded once here, hashed and sized as-is
+        is_text = isinstance(content, str)
+        content_bytes = content.encode("utf-8") if is_text else content
+        content_size = len(content_bytes)
         if content_size > self._max_file_size:
             raise ValueError(f"File too large: {content_size} > {self._max_file_size}")
 
@@ -139,23 +263,40 @@ class StorageService(BaseService):
         if not overwrite and path in self._files:
             raise ValueError(f"File already exists: {path}")
 
-        # Calculate hash
-        content_bytes = content.encode("utf-8") if isinstance(content, str) else content
-        content_hash = hashlib.sha256(content_bytes).hexdigest()
+        # Use the caller's hash if given, otherwise fingerprint with SHA-256
+        # (in the background for large files)
+        content_hash = params.get("content_hash")
+        hash_pending = False
+        if content_hash:
+            hash_algo = params.get("hash_algo", HASH_ALGO)
+        else:
+            hash_algo = HASH_ALGO
+            if content_size >= self._async_hash_min_bytes and not params.get("sync_hash"):
+                hash_pending = True
+            else:
+                content_hash = _content_hash(content_bytes)
 
         # Store file
-        now = datetime.utcnow()
-        self._files[path] = {
-            "content": content,
-            "metadata": {
-                "path": path,
-                "size_bytes": content_size,
-                "content_type": params.get("content_type", "text/plain"),
-                "content_hash": content_hash,
-                "created_at": now.isoformat(),
-                "updated_at": now.isoformat(),
-            }
-        }
+        previous = self._files.get(path)
+        if previous is None:
+            bisect.insort(self._paths_sorted, path)
+        else:
+            self._total_file_bytes -= previous.size_bytes
+        self._total_file_bytes += content_size
+        now = _iso_now()
+        record = self._files[path] = _FileRecord(
+            content=content_bytes,
+            path=path,
+            size_bytes=content_size,
+            content_type=params.get("content_type", "text/plain"),
+            content_hash=content_hash,
+            hash_algo=hash_algo,
+            created_at=now,
+            updated_at=now,
+            encoding="utf-8" if is_text else None,
+        )
+        if hash_pending:
+            self._hash_executor.submit(_fill_content_hash, record)
 
         logger.info(f"Saved file: {path} ({content_size} bytes)")
 
@@ -165,6 +306,8 @@ class StorageService(BaseService):
             "path": path,
             "size_bytes": content_size,
             "content_hash": content_hash,
+            "hash_algo": hash_algo,
+            "hash_pending": hash_pending,
             "message": f"File saved: {path}",
         }
 
@@ -174,6 +317,9 @@ class StorageService(BaseService):
 
         Params:
             path: File path
+            as_text: Decode content to str (default: True for files saved
+                as text, False for files saved as bytes). Otherwise content
+                is returned base64-encoded, with content_encoding="base64"
         """
         path = params.get("path")
         if not path:
@@ -182,14 +328,24 @@ class StorageService(BaseService):
         if path not in self._files:
             raise FileNotFoundError(f"File not found: {path}")
 
-        file_data = self._files[path]
+        record = self._files[path]
+        content = record.content
+
+        # Replies are JSON on the bus: raw bytes go out as base64
+        if params.get("as_text", record.encoding is not None):
+            content = content.decode(record.encoding or "utf-8")
+            content_encoding = None
+        else:
+            content = base64.b64encode(content).decode("ascii")
+            content_encoding = "base64"
 
         return {
             "action": "read_file",
             "status": "completed",
             "path": path,
-            "content": file_data["content"],
-            "metadata": file_data["metadata"],
+            "content": content,
+            "content_encoding": content_encoding,
+            "metadata": record.metadata(),
         }
 
     def _list_files(self, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -199,16 +355,21 @@ class StorageService(BaseService):
         Params:
             prefix: Filter by path prefix (optional)
             limit: Max number of results (default: 100)
+
+        Files are returned in lexicographic path order.
         """
         prefix = params.get("prefix", "")
         limit = params.get("limit", 100)
 
+        # Paths sharing the prefix are contiguous in sorted order
         files = []
-        for path, file_data in self._files.items():
-            if path.startswith(prefix):
-                files.append(file_data["metadata"])
-                if len(files) >= limit:
-                    break
+        paths = self._paths_sorted
+        stored = self._files
+        for i in range(bisect.bisect_left(paths, prefix), len(paths)):
+            path = paths[i]
+            if len(files) >= limit or not path.startswith(prefix):
+                break
+            files.append(stored[path].metadata())
 
         return {
             "action": "list_files",
@@ -232,7 +393,9 @@ class StorageService(BaseService):
         if path not in self._files:
             raise FileNotFoundError(f"File not found: {path}")
 
-        del self._files[path]
+        self._total_file_bytes -= self._files.pop(path).size_bytes
+        i = bisect.bisect_left(self._paths_sorted, path)
+        del self._paths_sorted[i]
 
         logger.info(f"Deleted file: {path}")
 
@@ -271,7 +434,7 @@ class StorageService(BaseService):
             "action": "get_file_info",
             "status": "completed",
             "path": path,
-            "metadata": self._files[path]["metadata"],
+            "metadata": self._files[path].metadata(),
         }
 
     # =========================================================================
@@ -297,17 +460,20 @@ class StorageService(BaseService):
         if data is None:
             raise ValueError("Missing required parameter: data")
 
-        now = datetime.utcnow()
-        self._artifacts[artifact_id] = {
-            "data": data,
-            "metadata": {
-                "artifact_id": artifact_id,
-                "task_id": params.get("task_id"),
-                "process_id": params.get("process_id"),
-                "artifact_type": params.get("artifact_type", "result"),
-                "created_at": now.isoformat(),
-            }
-        }
+        record = _ArtifactRecord(
+            data=data,
+            artifact_id=artifact_id,
+            task_id=params.get("task_id"),
+            process_id=params.get("process_id"),
+            artifact_type=params.get("artifact_type", "result"),
+            created_at=_iso_now(),
+        )
+
+        previous = self._artifacts.get(artifact_id)
+        if previous is not None:
+            self._unindex_artifact(previous)
+        self._artifacts[artifact_id] = record
+        self._index_artifact(record)
 
         logger.info(f"Saved artifact: {artifact_id}")
 
@@ -338,8 +504,8 @@ class StorageService(BaseService):
             "action": "get_artifact",
             "status": "completed",
             "artifact_id": artifact_id,
-            "data": artifact["data"],
-            "metadata": artifact["metadata"],
+            "data": artifact.data,
+            "metadata": artifact.metadata(),
         }
 
     def _list_artifacts(self, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -357,21 +523,34 @@ class StorageService(BaseService):
         artifact_type = params.get("artifact_type")
         limit = params.get("limit", 100)
 
+        filters = [
+            (field, value)
+            for field, value in (
+                ("task_id", task_id),
+                ("process_id", process_id),
+                ("artifact_type", artifact_type),
+            )
+            if value
+        ]
+
         artifacts = []
-        for artifact_id, artifact in self._artifacts.items():
-            meta = artifact["metadata"]
-
-            # Apply filters
-            if task_id and meta.get("task_id") != task_id:
-                continue
-            if process_id and meta.get("process_id") != process_id:
-                continue
-            if artifact_type and meta.get("artifact_type") != artifact_type:
-                continue
-
-            artifacts.append(meta)
-            if len(artifacts) >= limit:
-                break
+        if not filters:
+            for artifact in self._artifacts.values():
+                if len(artifacts) >= limit:
+                    break
+                artifacts.append(artifact.metadata())
+        else:
+            # Walk the smallest matching id set, check membership in the rest
+            index = self._artifact_index
+            candidates = sorted(
+                (index[field].get(value, {}) for field, value in filters), key=len
+            )
+            smallest, others = candidates[0], candidates[1:]
+            for artifact_id in smallest:
+                if len(artifacts) >= limit:
+                    break
+                if all(artifact_id in ids for ids in others):
+                    artifacts.append(self._artifacts[artifact_id].metadata())
 
         return {
             "action": "list_artifacts",
@@ -380,23 +559,36 @@ class StorageService(BaseService):
             "artifacts": artifacts,
         }
 
+    def _index_artifact(self, record: _ArtifactRecord) -> None:
+        """Add artifact to the secondary indexes."""
+        for field in ARTIFACT_INDEX_FIELDS:
+            value = getattr(record, field)
+            if value:
+                self._artifact_index[field].setdefault(value, {})[record.artifact_id] = None
+
+    def _unindex_artifact(self, record: _ArtifactRecord) -> None:
+        """Remove artifact from the secondary indexes."""
+        for field in ARTIFACT_INDEX_FIELDS:
+            value = getattr(record, field)
+            ids = self._artifact_index[field].get(value) if value else None
+            if ids is not None:
+                ids.pop(record.artifact_id, None)
+                if not ids:
+                    del self._artifact_index[field][value]
+
     # =========================================================================
     # Stats
     # =========================================================================
 
     def _get_storage_stats(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Get storage statistics."""
-        total_file_size = sum(
-            f["metadata"]["size_bytes"] for f in self._files.values()
-        )
-
         return {
             "action": "get_stats",
             "status": "completed",
             "stats": {
                 "files_count": len(self._files),
                 "artifacts_count": len(self._artifacts),
-                "total_file_size_bytes": total_file_size,
+                "total_file_size_bytes": self._total_file_bytes,
                 "max_file_size_bytes": self._max_file_size,
                 "max_files": self._max_files,
                 "storage_type": "in-memory",  # TODO: Change when persistent
@@ -12,36 +12,46 @@ Ready-Made Solutions:
 - fsspec: File system abstraction
 - SQLAlchemy: Database ORM
 - Pydantic: Data validation
+
+Submodules are imported lazily (PEP 562) on first attribute access, so
+importing one symbol does not pull in SQLAlchemy, Pydantic and fsspec.
 """
 
-from .models import (
-    ArtifactManifest,
-    ArtifactContext,
-    ArtifactModel,
-    ArtifactStatus,
-    ArtifactVisibility,
-    ModelParams,
-    generate_artifact_id,
-    compute_checksum,
-    ARTIFACT_TYPES,
-)
-from .file_storage import FileStorage
-from .storage_service import PersistentStorageService, StorageServiceHandler
-
-__all__ = [
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY = {
     # Models
-    "ArtifactManifest",
-    "ArtifactContext",
-    "ArtifactModel",
-    "ArtifactStatus",
-    "ArtifactVisibility",
-    "ModelParams",
-    "generate_artifact_id",
-    "compute_checksum",
-    "ARTIFACT_TYPES",
+    "ArtifactManifest": "models",
+    "ArtifactContext": "models",
+    "ArtifactModel": "models",
+    "ArtifactStatus": "models",
+    "ArtifactVisibility": "models",
+    "ModelParams": "models",
+    "generate_artifact_id": "models",
+    "validate_artifact_id": "models",
+    "compute_checksum": "models",
+    "ARTIFACT_TYPES": "models",
+    "ARTIFACT_TYPE_NAMES": "models",
     # File Storage
-    "FileStorage",
+    "FileStorage": "file_storage",
     # Storage Service
-    "PersistentStorageService",
-    "StorageServiceHandler",
-]
+    "PersistentStorageService": "storage_service",
+    "StorageServiceHandler": "storage_service",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache in module globals: later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -16,14 +16,23 @@ Ready-Made Solutions:
 
 import enum
 import hashlib
+import re
 import uuid
 from datetime import datetime
+from types import MappingProxyType
 from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field, field_validator
-from sqlalchemy import Column, DateTime, Enum, Integer, JSON, String, Text
+from sqlalchemy import Column, DateTime, Enum, Index, Integer, JSON, String, Text, insert, text
 from sqlalchemy.ext.declarative import declarative_base
 
+# Artifact ID format: art_ + UUID4 (Invariant 8)
+ARTIFACT_ID_PATTERN = r"^art_[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}$"
+_ART_ID_RE = re.compile(ARTIFACT_ID_PATTERN)
+
+# Rows per executemany call in ArtifactModel.bulk_insert_manifests
+BULK_INSERT_PAGE_SIZE = 1000
+
 # =============================================================================
 # Pydantic Models (for validation and API)
 # =============================================================================
@@ -31,6 +40,8 @@ from sqlalchemy.ext.declarative import declarative_base
 
 class ModelParams(BaseModel):
     """LLM model parameters for reproducibility."""
+    model_config = {"frozen": True}
+
     temperature: Optional[float] = Field(None, ge=0.0, le=2.0)
     max_tokens: Optional[int] = Field(None, ge=1)
 
@@ -63,7 +74,7 @@ class ArtifactManifest(BaseModel):
     id: str = Field(
         min_length=1,
         max_length=100,
-        pattern=r"^art_[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}$",
+        pattern=ARTIFACT_ID_PATTERN,
         description="Unique artifact ID (art_ + UUID4)"
     )
     version: int = Field(ge=1, default=1, description="Artifact version")
@@ -147,6 +158,30 @@ class ArtifactManifest(BaseModel):
         }
 
 
+def _context_to_dict(ctx: ArtifactContext) -> Dict[str, Any]:
+    """
+    Same result as ctx.model_dump(exclude_none=True), built by hand.
+
+    Used on every artifact write; keep in sync with ArtifactContext fields.
+    """
+    d: Dict[str, Any] = {}
+    if ctx.prompt_version is not None:
+        d["prompt_version"] = ctx.prompt_version
+    if ctx.model_name is not None:
+        d["model_name"] = ctx.model_name
+    params = ctx.model_params
+    if params is not None:
+        d["model_params"] = {
+            k: v
+            for k, v in (("temperature", params.temperature), ("max_tokens", params.max_tokens))
+            if v is not None
+        }
+    d["input_artifacts"] = list(ctx.input_artifacts)
+    if ctx.execution_time_ms is not None:
+        d["execution_time_ms"] = ctx.execution_time_ms
+    return d
+
+
 # =============================================================================
 # SQLAlchemy Models (for database persistence)
 # =============================================================================
@@ -178,25 +213,44 @@ class ArtifactModel(Base):
     Invariant 2: Fields are immutable after creation (except status).
     """
     __tablename__ = "artifacts"
+    __table_args__ = (
+        # Leading trace_id also serves single-column trace_id filters
+        Index("ix_art_trace_type_ver", "trace_id", "artifact_type", "version"),
+        Index("ix_art_trace_status", "trace_id", "status"),
+        # Not unique: identical content may back several artifacts
+        # (hard-linked, see PersistentStorageService._register_artifact_internal)
+        Index("ix_art_checksum", "checksum"),
+        # list_artifacts: single filter + ORDER BY created_at (scanned in reverse)
+        Index("ix_art_trace_created", "trace_id", "created_at"),
+        Index("ix_art_creator_created", "created_by", "created_at"),
+        Index("ix_art_type_created", "artifact_type", "created_at"),
+        Index("ix_art_status_created", "status", "created_at"),
+        # Startup recovery scans only the few rows still uploading.
+        # SQLAlchemy stores Enum members by name.
+        Index(
+            "ix_art_uploading", "status",
+            sqlite_where=text("status = 'UPLOADING'"),
+        ),
+    )
 
     # Primary key
     id = Column(String(100), primary_key=True)
     version = Column(Integer, nullable=False, default=1)
 
     # Process link
-    trace_id = Column(String(100), nullable=False, index=True)
+    trace_id = Column(String(100), nullable=False)
     step_id = Column(String(100), nullable=True)
-    created_by = Column(String(100), nullable=False, index=True)
+    created_by = Column(String(100), nullable=False)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
 
     # Type
-    artifact_type = Column(String(50), nullable=False, index=True)
+    artifact_type = Column(String(50), nullable=False)
     content_type = Column(String(100), nullable=False, default="application/json")
 
     # Location
     uri = Column(Text, nullable=False)
     size_bytes = Column(Integer, nullable=False)
-    checksum = Column(String(100), nullable=False, unique=True)
+    checksum = Column(String(100), nullable=False)
 
     # Lifecycle
     status = Column(Enum(ArtifactStatus), nullable=False, default=ArtifactStatus.UPLOADING)
@@ -213,28 +267,42 @@ class ArtifactModel(Base):
     supersedes = Column(String(100), nullable=True)
 
     def to_manifest(self) -> ArtifactManifest:
-        """Convert SQLAlchemy model to Pydantic ArtifactManifest."""
+        """
+        Convert SQLAlchemy model to Pydantic ArtifactManifest.
+
+        Rows were validated on the way in (from_manifest), so the manifest
+        is built with model_construct() and skips re-validation.
+        """
+        return self.row_to_manifest(self)
+
+    @staticmethod
+    def row_to_manifest(row) -> ArtifactManifest:
+        """
+        Build an ArtifactManifest from anything with the artifact columns
+        as attributes: an ArtifactModel or a Core Row selected from
+        ArtifactModel.__table__ (no ORM instance needed).
+        """
         context_data = None
-        if self.context:
-            context_data = ArtifactContext(**self.context)
-
-        return ArtifactManifest(
-            id=self.id,
-            version=self.version,
-            supersedes=self.supersedes,
-            trace_id=self.trace_id,
-            step_id=self.step_id,
-            created_by=self.created_by,
-            created_at=self.created_at,
-            artifact_type=self.artifact_type,
-            content_type=self.content_type,
-            uri=self.uri,
-            size_bytes=self.size_bytes,
-            checksum=self.checksum,
-            status=self.status.value,
-            retention=self.retention,
-            owner=self.owner,
-            visibility=self.visibility.value,
+        if row.context:
+            context_data = ArtifactContext(**row.context)
+
+        return ArtifactManifest.model_construct(
+            id=row.id,
+            version=row.version,
+            supersedes=row.supersedes,
+            trace_id=row.trace_id,
+            step_id=row.step_id,
+            created_by=row.created_by,
+            created_at=row.created_at,
+            artifact_type=row.artifact_type,
+            content_type=row.content_type,
+            uri=row.uri,
+            size_bytes=row.size_bytes,
+            checksum=row.checksum,
+            status=row.status.value,
+            retention=row.retention,
+            owner=row.owner,
+            visibility=row.visibility.value,
             context=context_data,
         )
 
@@ -243,7 +311,7 @@ class ArtifactModel(Base):
         """Create SQLAlchemy model from Pydantic ArtifactManifest."""
         context_dict = None
         if manifest.context:
-            context_dict = manifest.context.model_dump(exclude_none=True)
+            context_dict = _context_to_dict(manifest.context)
 
         return cls(
             id=manifest.id,
@@ -265,6 +333,54 @@ class ArtifactModel(Base):
             context=context_dict,
         )
 
+    @classmethod
+    def bulk_insert_manifests(
+        cls,
+        session,
+        manifests: List[ArtifactManifest],
+        page_size: int = BULK_INSERT_PAGE_SIZE,
+    ) -> None:
+        """
+        INSERT many manifests with Core executemany, page_size rows per call.
+
+        Skips ORM unit-of-work bookkeeping; use when no ORM instances are
+        needed afterwards (e.g. draining the buffer on recovery). All pages
+        run in the caller's transaction.
+
+        Args:
+            session: SQLAlchemy session (caller commits)
+            manifests: Manifests to insert
+            page_size: Rows per executemany call
+        """
+        if not manifests:
+            return
+
+        rows = [
+            {
+                "id": m.id,
+                "version": m.version,
+                "supersedes": m.supersedes,
+                "trace_id": m.trace_id,
+                "step_id": m.step_id,
+                "created_by": m.created_by,
+                "created_at": m.created_at,
+                "artifact_type": m.artifact_type,
+                "content_type": m.content_type,
+                "uri": m.uri,
+                "size_bytes": m.size_bytes,
+                "checksum": m.checksum,
+                "status": ArtifactStatus(m.status),
+                "retention": m.retention,
+                "owner": m.owner,
+                "visibility": ArtifactVisibility(m.visibility),
+                "context": _context_to_dict(m.context) if m.context else None,
+            }
+            for m in manifests
+        ]
+        stmt = insert(cls.__table__)
+        for start in range(0, len(rows), page_size):
+            session.execute(stmt, rows[start:start + page_size])
+
 
 # =============================================================================
 # Helper Functions
@@ -280,7 +396,21 @@ def generate_artifact_id() -> str:
 
     Invariant 8: Artifact ID Uniqueness
     """
-    return f"art_{uuid.uuid4()}"
+    # Slice the hex form: cheaper than str(UUID)'s formatting path
+    h = uuid.uuid4().hex
+    return f"art_{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def validate_artifact_id(artifact_id: str) -> str:
+    """
+    Validate artifact ID format (art_ + UUID4) at API boundaries.
+
+    Raises:
+        ValueError: If the ID is malformed
+    """
+    if not _ART_ID_RE.fullmatch(artifact_id):
+        raise ValueError(f"Invalid artifact ID: {artifact_id}")
+    return artifact_id
 
 
 def compute_checksum(content: bytes) -> str:
@@ -294,7 +424,7 @@ def compute_checksum(content: bytes) -> str:
 
 
 # Standard artifact types (from STORAGE_SPEC_v1.1.md Section 3.2)
-ARTIFACT_TYPES = {
+ARTIFACT_TYPES = MappingProxyType({
     "research_report": "Research result",
     "idea": "Generated idea",
     "critique": "Critical analysis",
@@ -303,4 +433,7 @@ ARTIFACT_TYPES = {
     "final": "Final result",
     "log": "Execution log",
     "intermediate": "Intermediate result",
-}
+})
+
+# Type names only, for membership checks
+ARTIFACT_TYPE_NAMES = frozenset(ARTIFACT_TYPES)
@@ -19,15 +19,25 @@ Ready-Made Solutions:
 - Pydantic: Data validation
 """
 
-import json
+import binascii
+import contextlib
+import io
 import logging
 import os
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
-from sqlalchemy import create_engine, and_, or_
+from pydantic import TypeAdapter
+from sqlalchemy import (
+    UniqueConstraint, create_engine, delete, event, func, inspect, and_, or_, select, update,
+)
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.schema import CreateIndex, CreateTable
 
 from .models import (
     ArtifactManifest,
@@ -37,12 +47,71 @@ from .models import (
     ArtifactContext,
     Base,
     generate_artifact_id,
-    compute_checksum,
+    validate_artifact_id,
 )
 from .file_storage import FileStorage
 
 logger = logging.getLogger(__name__)
 
+# Reused JSON serializer for buffered manifests (dump_json returns bytes)
+_MANIFEST_ADAPTER = TypeAdapter(ArtifactManifest)
+
+# Dumps a whole manifest list in one serializer call (list_artifacts replies)
+_MANIFEST_LIST_ADAPTER = TypeAdapter(List[ArtifactManifest])
+
+# Applied to every new SQLite connection. WAL lets readers run alongside a
+# writer. synchronous=NORMAL drops the fsync on every commit: the database
+# stays consistent, but the last committed transactions can be lost on power
+# loss or an OS crash (an application crash loses nothing).
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+    "PRAGMA cache_size=-65536",  # 64 MiB
+)
+
+
+# Completed manifests kept by get_artifact (LRU), and for how long
+MANIFEST_CACHE_SIZE = 1024
+MANIFEST_CACHE_TTL_SECONDS = 1.0
+
+# Threads checking file presence for stuck uploads in _startup_recovery
+RECOVERY_STAT_WORKERS = 32
+
+# Rows fetched per batch by list_artifacts
+LIST_FETCH_BATCH_SIZE = 256
+
+# Input block for chunked base64 (multiple of 3: no padding inside the output)
+B64_CHUNK_SIZE = 3 << 20  # 3 MiB
+
+
+def _b64encode_chunked(data: memoryview, chunk_size: int = B64_CHUNK_SIZE) -> str:
+    """
+    Base64-encode data block by block into one preallocated buffer.
+
+    Only one chunk-sized temporary exists at a time, instead of a full
+    encoded bytes object next to the final str.
+    """
+    size = len(data)
+    out = bytearray((size + 2) // 3 * 4)
+    pos = 0
+    for offset in range(0, size, chunk_size):
+        encoded = binascii.b2a_base64(data[offset:offset + chunk_size], newline=False)
+        out[pos:pos + len(encoded)] = encoded
+        pos += len(encoded)
+    return out.decode("ascii")
+
+
+def _apply_sqlite_pragmas(dbapi_conn, connection_record) -> None:
+    """SQLAlchemy "connect" listener: tune a fresh SQLite connection."""
+    cursor = dbapi_conn.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
 
 class PersistentStorageService:
     """
@@ -95,7 +164,11 @@ class PersistentStorageService:
             echo=False,
             connect_args={"check_same_thread": False}
         )
+        event.listen(self.engine, "connect", _apply_sqlite_pragmas)
         Base.metadata.create_all(self.engine)
+        self._sync_indexes()
+        with self.engine.connect() as conn:
+            conn.exec_driver_sql("PRAGMA optimize")
         self.SessionLocal = sessionmaker(bind=self.engine)
 
         # Initialize FileStorage
@@ -110,6 +183,16 @@ class PersistentStorageService:
         self.buffer_max_size_mb = buffer_max_size_mb
         self.buffer_max_items = buffer_max_items
 
+        # Completed manifests by ID: (expires_at monotonic, manifest)
+        self._manifest_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._manifest_cache_lock = threading.Lock()
+        # Bumped by every invalidation; a read that started before one does
+        # not cache its (possibly stale) row
+        self._manifest_generation = 0
+
+        # Buffered artifact IDs, oldest first (seeded after recovery)
+        self._buffer_index: deque = deque()
+
         logger.info(
             f"PersistentStorageService initialized: db={self.db_path}, "
             f"artifacts={base_path}"
@@ -117,6 +200,100 @@ class PersistentStorageService:
 
         # Run startup recovery
         self._startup_recovery()
+        self._buffer_index.extend(
+            self.file_storage.list_buffered_artifacts(oldest_first=True)
+        )
+
+    def _sync_indexes(self) -> None:
+        """
+        Bring indexes of an existing database in line with ArtifactModel.
+
+        create_all skips tables that already exist, so missing indexes are
+        created here, indexes whose uniqueness changed are rebuilt, and
+        ix_* indexes no longer declared are dropped.
+        Table-level UNIQUE constraints that are no longer declared (the
+        original schema had UNIQUE (checksum)) cannot be dropped in SQLite;
+        the table is rebuilt instead.
+        """
+        table = ArtifactModel.__table__
+        inspector = inspect(self.engine)
+        declared_unique = {
+            tuple(c.columns.keys())
+            for c in table.constraints
+            if isinstance(c, UniqueConstraint)
+        }
+        stale_unique = [
+            uc for uc in inspector.get_unique_constraints(table.name)
+            if tuple(uc["column_names"]) not in declared_unique
+        ]
+        if stale_unique:
+            self._rebuild_table(inspector)
+            return
+
+        existing = {
+            ix["name"]: bool(ix["unique"])
+            for ix in inspector.get_indexes(table.name)
+        }
+        # Drop indexes no longer declared (e.g. the single-column
+        # ix_artifacts_* ones superseded by composites); writes maintain them
+        declared = {index.name for index in table.indexes}
+        stale = [name for name in existing if name.startswith("ix_") and name not in declared]
+        if stale:
+            with self.engine.begin() as conn:
+                for name in stale:
+                    conn.exec_driver_sql(f'DROP INDEX "{name}"')
+            logger.info(f"Dropped stale indexes on {table.name}: {', '.join(stale)}")
+        for index in table.indexes:
+            unique = existing.get(index.name)
+            if unique is not None and unique != bool(index.unique):
+                index.drop(self.engine)
+                unique = None
+            if unique is None:
+                index.create(self.engine)
+
+    def _rebuild_table(self, inspector) -> None:
+        """
+        Recreate the artifacts table from ArtifactModel, keeping its rows.
+
+        SQLite's ALTER TABLE cannot drop constraints, so this is the usual
+        rename / create / copy / drop sequence, run in one transaction.
+        """
+        table = ArtifactModel.__table__
+        old_name = f"{table.name}_old"
+        existing_columns = {c["name"] for c in inspector.get_columns(table.name)}
+        columns = ", ".join(c.name for c in table.columns if c.name in existing_columns)
+        old_indexes = [ix["name"] for ix in inspector.get_indexes(table.name)]
+
+        logger.info(f"Rebuilding table {table.name} to match the current schema")
+        raw = self.engine.raw_connection()
+        try:
+            # Driver-level transaction: pysqlite would autocommit the DDL
+            conn = raw.driver_connection
+            isolation_level = conn.isolation_level
+            conn.isolation_level = None
+            try:
+                conn.execute("BEGIN")
+                try:
+                    # Index names are global in SQLite: free them for the new table
+                    for name in old_indexes:
+                        conn.execute(f'DROP INDEX "{name}"')
+                    conn.execute(f'ALTER TABLE "{table.name}" RENAME TO "{old_name}"')
+                    conn.execute(str(CreateTable(table).compile(self.engine)))
+                    for index in table.indexes:
+                        conn.execute(str(CreateIndex(index).compile(self.engine)))
+                    conn.execute(
+                        f'INSERT INTO "{table.name}" ({columns}) '
+                        f'SELECT {columns} FROM "{old_name}"'
+                    )
+                    conn.execute(f'DROP TABLE "{old_name}"')
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+            finally:
+                conn.isolation_level = isolation_level
+        finally:
+            raw.close()
 
     # =========================================================================
     # Startup Recovery (STORAGE_SPEC_v1.1 Section 5.3)
@@ -130,50 +307,149 @@ class PersistentStorageService:
         2. For each incomplete: check if file exists
         3. If file exists → complete registration
         4. If file missing → move metadata to failed
-        5. Process buffered artifacts
+        5. Move permanent files without metadata to orphans
+        6. Process buffered artifacts
         """
         logger.info("Starting recovery procedure...")
 
-        with self.SessionLocal() as session:
-            # Find incomplete artifacts
-            incomplete = session.query(ArtifactModel).filter(
-                ArtifactModel.status == ArtifactStatus.UPLOADING
+        with self.SessionLocal() as session, session.begin():
+            # Find incomplete artifacts (id and uri only, no ORM objects)
+            incomplete = session.execute(
+                select(ArtifactModel.id, ArtifactModel.uri).where(
+                    ArtifactModel.status == ArtifactStatus.UPLOADING
+                )
             ).all()
 
-            for artifact in incomplete:
-                if self.file_storage.exists(artifact.uri):
+            # exists() is a stat (releases the GIL): check files in parallel
+            uris = [uri for _, uri in incomplete]
+            if len(uris) > 1:
+                workers = min(RECOVERY_STAT_WORKERS, len(uris))
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    present = list(pool.map(self.file_storage.exists, uris))
+            else:
+                present = [self.file_storage.exists(uri) for uri in uris]
+
+            ok_ids = []
+            missing_ids = []
+            for (artifact_id, _), exists in zip(incomplete, present):
+                if exists:
                     # File exists, complete registration
-                    artifact.status = ArtifactStatus.COMPLETED
-                    logger.info(f"Recovery: completed {artifact.id}")
+                    ok_ids.append(artifact_id)
+                    logger.info(f"Recovery: completed {artifact_id}")
                 else:
                     # File missing, mark as failed
-                    artifact.status = ArtifactStatus.FAILED
-                    logger.warning(f"Recovery: marked failed {artifact.id} (file missing)")
+                    missing_ids.append(artifact_id)
+                    logger.warning(f"Recovery: marked failed {artifact_id} (file missing)")
+
+            # One UPDATE per outcome instead of one per row
+            for ids, status in (
+                (ok_ids, ArtifactStatus.COMPLETED),
+                (missing_ids, ArtifactStatus.FAILED),
+            ):
+                if ids:
+                    session.execute(
+                        update(ArtifactModel)
+                        .where(ArtifactModel.id.in_(ids))
+                        .values(status=status)
+                    )
 
-            session.commit()
+        self._reconcile_permanent_files()
 
         # Process buffered artifacts
         buffered = self.file_storage.list_buffered_artifacts()
-        for artifact_id in buffered:
+        if buffered:
+            self._process_buffered_artifacts(buffered)
+
+        logger.info(f"Recovery complete: {len(incomplete)} incomplete, {len(buffered)} buffered")
+
+    def _reconcile_permanent_files(self) -> None:
+        """
+        Move permanent files that have no metadata row to orphans.
+
+        Registration places the file before inserting its row, so a crash
+        between the two leaves a file no row points to. Files are matched
+        by the artifact ID prefixing their name, not by URI, since stored
+        URIs are absolute and go stale when the data directory moves.
+        Runs before any registration, so no file can be mid-registration.
+        """
+        with self.SessionLocal() as session:
+            known = set(session.execute(select(ArtifactModel.id)).scalars())
+
+        orphaned = 0
+        for uri in self.file_storage.list_permanent_files():
+            # Permanent names are "{artifact_id}_{filename}", art_{uuid4} IDs
+            name = uri.rsplit("/", 1)[-1]
+            if not name.startswith("art_"):
+                continue
+            if "_".join(name.split("_", 2)[:2]) in known:
+                continue
             try:
-                self._process_buffered_artifact(artifact_id)
+                self.file_storage.move_to_orphans(uri)
+                orphaned += 1
             except Exception as e:
-                logger.error(f"Recovery: failed to process buffered {artifact_id}: {e}")
+                logger.error(f"Recovery: failed to orphan {uri}: {e}")
 
-        logger.info(f"Recovery complete: {len(incomplete)} incomplete, {len(buffered)} buffered")
+        if orphaned:
+            logger.warning(f"Recovery: moved {orphaned} unregistered files to orphans")
+
+    def _process_buffered_artifacts(self, artifact_ids: List[str]) -> None:
+        """
+        Re-register buffered artifacts in a single transaction.
+
+        Files are renamed from the buffer into permanent storage first (no
+        content is read or rewritten), then all metadata rows are inserted in
+        pages and committed once (one fsync instead of one per artifact). If
+        the batch fails, falls back to one insert per artifact.
+        """
+        manifests = []
+        for artifact_id in artifact_ids:
+            try:
+                manifest_json = self.file_storage.get_buffered_manifest(artifact_id)
+                manifest = ArtifactManifest.model_validate_json(manifest_json)
+                manifest.uri = self.file_storage.place_buffered_artifact(
+                    artifact_id, manifest.trace_id, f"{manifest.id}_artifact"
+                )
+                manifest.status = "completed"
+                manifests.append(manifest)
+            except Exception as e:
+                logger.error(f"Recovery: failed to process buffered {artifact_id}: {e}")
 
-    def _process_buffered_artifact(self, artifact_id: str) -> None:
-        """Process a single buffered artifact."""
-        content, manifest_json = self.file_storage.get_buffered_artifact(artifact_id)
-        manifest_dict = json.loads(manifest_json)
-        manifest = ArtifactManifest(**manifest_dict)
+        if not manifests:
+            return
+
+        try:
+            with self.SessionLocal() as session, session.begin():
+                ArtifactModel.bulk_insert_manifests(session, manifests)
+            batched = True
+        except Exception as e:
+            logger.warning(f"Recovery: batch insert failed, retrying one by one: {e}")
+            batched = False
+
+        if not batched:
+            for manifest in manifests:
+                try:
+                    self._process_buffered_artifact(manifest)
+                except Exception as e:
+                    logger.error(f"Recovery: failed to process buffered {manifest.id}: {e}")
+            return
+
+        for manifest in manifests:
+            self.file_storage.remove_buffered_artifact(manifest.id)
+            logger.info(f"Processed buffered artifact: {manifest.id}")
+
+    def _process_buffered_artifact(self, manifest: ArtifactManifest) -> None:
+        """
+        Commit metadata for a single buffered artifact already placed in
+        permanent storage, then drop it from the buffer.
 
-        # Re-register the artifact
-        self._register_artifact_internal(manifest, content)
+        If the insert fails the buffer entry is kept; the next recovery finds
+        the file already placed and retries the insert.
+        """
+        with self.SessionLocal() as session, session.begin():
+            ArtifactModel.bulk_insert_manifests(session, [manifest])
 
-        # Remove from buffer
-        self.file_storage.remove_buffered_artifact(artifact_id)
-        logger.info(f"Processed buffered artifact: {artifact_id}")
+        self.file_storage.remove_buffered_artifact(manifest.id)
+        logger.info(f"Processed buffered artifact: {manifest.id}")
 
     # =========================================================================
     # Artifact Registration (STORAGE_SPEC_v1.1 Section 5)
@@ -199,9 +475,11 @@ class PersistentStorageService:
         2. Upload file to temp
         3. Compute checksum
         4. Create manifest
-        5. INSERT metadata (status=uploading)
-        6. Move file to permanent location (atomic)
-        7. UPDATE status=completed
+        5. Move file to permanent location (atomic)
+        6. INSERT metadata (status=completed) — the commit point
+
+        A crash between 5 and 6 leaves an unreferenced file (GC), never a
+        row without its file (Invariant 1).
 
         Args:
             content: File content
@@ -220,16 +498,15 @@ class PersistentStorageService:
         # Step 1: Generate artifact_id
         artifact_id = generate_artifact_id()
 
-        # Step 2: Upload to temp
-        temp_uri = self.file_storage.upload_to_temp(content, f"{artifact_id}_{filename}")
-
-        # Step 3: Compute checksum
-        checksum = compute_checksum(content)
+        # Steps 2-3: Upload to temp, computing the checksum while writing
+        temp_uri, _, checksum = self.file_storage.upload_to_temp_stream(
+            io.BytesIO(content), f"{artifact_id}_{filename}"
+        )
 
         # Step 4: Create manifest
         artifact_context = None
         if context:
-            artifact_context = ArtifactContext(**context)
+            artifact_context = ArtifactContext.model_validate(context)
 
         manifest = ArtifactManifest(
             id=artifact_id,
@@ -262,78 +539,170 @@ class PersistentStorageService:
         """
         Internal artifact registration with database operations.
 
-        Handles both fresh registration and buffered artifact processing.
+        Places the file first, then commits the metadata row already in its
+        final state with one INSERT (no INSERT uploading + UPDATE completed).
         """
-        with self.SessionLocal() as session:
-            try:
-                # Step 5: INSERT metadata (status=uploading)
-                db_artifact = ArtifactModel.from_manifest(manifest)
-                session.add(db_artifact)
-                session.flush()  # Get ID assigned
-
-                # Step 6: Move file to permanent location (atomic)
-                if temp_uri and filename and trace_id:
-                    permanent_uri = self.file_storage.move_to_permanent(
-                        temp_uri, trace_id, f"{manifest.id}_{filename}"
-                    )
-                else:
-                    # For buffered artifacts, upload directly
-                    permanent_uri = self.file_storage.upload(
-                        content,
-                        manifest.trace_id,
-                        f"{manifest.id}_artifact"
-                    )
-
-                # Step 7: UPDATE status=completed and URI
-                db_artifact.uri = permanent_uri
-                db_artifact.status = ArtifactStatus.COMPLETED
-
-                session.commit()
-
-                # Return updated manifest
-                manifest.uri = permanent_uri
-                manifest.status = "completed"
-
-                logger.info(f"Registered artifact: {manifest.id}")
-                return manifest
-
-            except Exception as e:
-                session.rollback()
-                logger.error(f"Failed to register artifact {manifest.id}: {e}")
+        from_temp = bool(temp_uri and filename and trace_id)
+        if from_temp:
+            dest_trace, dest_name = trace_id, f"{manifest.id}_{filename}"
+        else:
+            dest_trace, dest_name = manifest.trace_id, f"{manifest.id}_artifact"
+
+        permanent_uri = None
+        try:
+            # Step 5: Move file to permanent location (atomic). Content that
+            # is already stored is hard-linked instead (content-addressed
+            # by checksum), so duplicates take no extra space.
+            permanent_uri = self._link_duplicate(manifest, dest_trace, dest_name)
+            if permanent_uri is not None:
+                if temp_uri:
+                    self.file_storage.delete(temp_uri)
+            elif from_temp:
+                permanent_uri = self.file_storage.move_to_permanent(
+                    temp_uri, dest_trace, dest_name
+                )
+            else:
+                permanent_uri = self.file_storage.upload(content, dest_trace, dest_name)
+
+            # Step 6: INSERT metadata (status=completed)
+            manifest.uri = permanent_uri
+            manifest.status = "completed"
+            with self.SessionLocal() as session, session.begin():
+                ArtifactModel.bulk_insert_manifests(session, [manifest])
+
+            self._invalidate_manifest(manifest.id)
+
+            logger.info(f"Registered artifact: {manifest.id}")
+            return manifest
+
+        except Exception as e:
+            logger.error(f"Failed to register artifact {manifest.id}: {e}")
+
+            # Buffer for later retry (graceful degradation); the content is
+            # moved from wherever it got to
+            manifest.status = "uploading"
+            self._buffer_artifact(manifest, content, permanent_uri or temp_uri)
+            raise
+
+    def _link_duplicate(
+        self, manifest: ArtifactManifest, trace_id: str, filename: str
+    ) -> Optional[str]:
+        """
+        Hard-link an already stored file with the same checksum.
 
-                # Buffer for later retry (graceful degradation)
-                self._buffer_artifact(manifest, content)
-                raise
+        Returns:
+            Permanent URI of the new link, or None if there is no stored
+            copy or it cannot be linked (remote, missing, other device)
+        """
+        with self.SessionLocal() as session:
+            existing_uri = session.execute(
+                select(ArtifactModel.uri)
+                .where(ArtifactModel.checksum == manifest.checksum)
+                .where(ArtifactModel.status == ArtifactStatus.COMPLETED)
+                .limit(1)
+            ).scalar()
+
+        if existing_uri is None:
+            return None
+        try:
+            uri = self.file_storage.link_to_permanent(existing_uri, trace_id, filename)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Dedup link failed for {manifest.id}, storing a copy: {e}")
+            return None
+
+        logger.info(f"Deduplicated artifact {manifest.id}: linked to {existing_uri}")
+        return uri
+
+    def _buffer_artifact(
+        self,
+        manifest: ArtifactManifest,
+        content: bytes,
+        temp_uri: Optional[str] = None,
+    ) -> None:
+        """
+        Buffer artifact for later retry.
 
-    def _buffer_artifact(self, manifest: ArtifactManifest, content: bytes) -> None:
-        """Buffer artifact for later retry."""
-        # Check buffer limits
-        buffered = self.file_storage.list_buffered_artifacts()
-        if len(buffered) >= self.buffer_max_items:
+        If the content is still in temp storage it is moved into the buffer
+        instead of being written again.
+        """
+        # Check buffer limits (in-memory index, no directory scan)
+        index = self._buffer_index
+        while index and len(index) >= self.buffer_max_items:
             # FIFO eviction
-            oldest = buffered[0]
+            oldest = index.popleft()
             self.file_storage.remove_buffered_artifact(oldest)
             logger.warning(f"Buffer full, evicted oldest: {oldest}")
 
-        manifest_json = manifest.model_dump_json()
-        self.file_storage.buffer_artifact(manifest.id, content, manifest_json)
+        manifest_json = _MANIFEST_ADAPTER.dump_json(manifest)
+        moved = False
+        if temp_uri and self.file_storage.exists(temp_uri):
+            try:
+                self.file_storage.buffer_existing_artifact(temp_uri, manifest.id, manifest_json)
+                moved = True
+            except OSError as e:
+                logger.warning(f"Could not move temp file into buffer, rewriting: {e}")
+        if not moved:
+            self.file_storage.buffer_artifact(manifest.id, content, manifest_json)
+
+        # Indexed only once the buffered files exist
+        index.append(manifest.id)
         logger.info(f"Buffered artifact: {manifest.id}")
 
     # =========================================================================
     # Artifact Retrieval
     # =========================================================================
 
-    def get_artifact(self, artifact_id: str) -> Optional[ArtifactManifest]:
+    @contextlib.contextmanager
+    def session_scope(self) -> Iterator[Session]:
+        """
+        One session for a group of calls (e.g. one MindBus command).
+
+        Pass it as ``session=`` to the read/delete methods below so they
+        share a connection and transaction; committed on success.
+        """
+        with self.SessionLocal() as session:
+            yield session
+            session.commit()
+
+    def _session(self, session: Optional[Session]):
+        """Context manager over the caller's session, or a new one."""
+        if session is not None:
+            return contextlib.nullcontext(session)
+        return self.SessionLocal()
+
+    def _invalidate_manifest(self, artifact_id: str) -> None:
+        """Drop an artifact from the manifest cache."""
+        with self._manifest_cache_lock:
+            self._manifest_cache.pop(artifact_id, None)
+            self._manifest_generation += 1
+
+    def get_artifact(
+        self, artifact_id: str, session: Optional[Session] = None
+    ) -> Optional[ArtifactManifest]:
         """
         Get artifact manifest by ID.
 
         Args:
             artifact_id: Artifact ID
+            session: Optional session to reuse (see session_scope)
 
         Returns:
             ArtifactManifest or None if not found
         """
-        with self.SessionLocal() as session:
+        # Completed manifests are immutable (Invariant 2): serve repeats
+        # from a short-lived cache. Callers get a deep copy they may modify.
+        cache = self._manifest_cache
+        now = time.monotonic()
+        with self._manifest_cache_lock:
+            entry = cache.get(artifact_id)
+            if entry is not None:
+                if entry[0] > now:
+                    cache.move_to_end(artifact_id)
+                    return entry[1].model_copy(deep=True)
+                cache.pop(artifact_id, None)
+            generation = self._manifest_generation
+
+        with self._session(session) as session:
             db_artifact = session.query(ArtifactModel).filter(
                 ArtifactModel.id == artifact_id
             ).first()
@@ -341,14 +710,27 @@ class PersistentStorageService:
             if db_artifact is None:
                 return None
 
-            return db_artifact.to_manifest()
-
-    def get_artifact_content(self, artifact_id: str) -> bytes:
+            manifest = db_artifact.to_manifest()
+
+        if manifest.status == ArtifactStatus.COMPLETED.value:
+            with self._manifest_cache_lock:
+                # Skip if a delete/update invalidated while we were reading
+                if self._manifest_generation == generation:
+                    cache[artifact_id] = (now + MANIFEST_CACHE_TTL_SECONDS, manifest)
+                    if len(cache) > MANIFEST_CACHE_SIZE:
+                        cache.popitem(last=False)
+            return manifest.model_copy(deep=True)
+        return manifest
+
+    def get_artifact_content(
+        self, artifact_id: str, session: Optional[Session] = None
+    ) -> bytes:
         """
         Get artifact file content.
 
         Args:
             artifact_id: Artifact ID
+            session: Optional session to reuse (see session_scope)
 
         Returns:
             File content
@@ -356,12 +738,31 @@ class PersistentStorageService:
         Raises:
             FileNotFoundError: If artifact not found
         """
-        manifest = self.get_artifact(artifact_id)
+        manifest = self.get_artifact(artifact_id, session)
         if manifest is None:
             raise FileNotFoundError(f"Artifact not found: {artifact_id}")
 
         return self.file_storage.read(manifest.uri)
 
+    def open_artifact_content(self, artifact_id: str, session: Optional[Session] = None):
+        """
+        Map artifact content for reading without copying it.
+
+        Context manager yielding a memoryview (see FileStorage.read_mmap).
+
+        Args:
+            artifact_id: Artifact ID
+            session: Optional session to reuse (see session_scope)
+
+        Raises:
+            FileNotFoundError: If artifact not found
+        """
+        manifest = self.get_artifact(artifact_id, session)
+        if manifest is None:
+            raise FileNotFoundError(f"Artifact not found: {artifact_id}")
+
+        return self.file_storage.read_mmap(manifest.uri)
+
     def list_artifacts(
         self,
         trace_id: Optional[str] = None,
@@ -370,6 +771,7 @@ class PersistentStorageService:
         status: Optional[str] = None,
         limit: int = 100,
         offset: int = 0,
+        session: Optional[Session] = None,
     ) -> List[ArtifactManifest]:
         """
         List artifacts with filters.
@@ -381,26 +783,31 @@ class PersistentStorageService:
             status: Filter by status
             limit: Maximum results
             offset: Result offset
+            session: Optional session to reuse (see session_scope)
 
         Returns:
             List of ArtifactManifest
         """
-        with self.SessionLocal() as session:
-            query = session.query(ArtifactModel)
-
-            if trace_id:
-                query = query.filter(ArtifactModel.trace_id == trace_id)
-            if created_by:
-                query = query.filter(ArtifactModel.created_by == created_by)
-            if artifact_type:
-                query = query.filter(ArtifactModel.artifact_type == artifact_type)
-            if status:
-                query = query.filter(ArtifactModel.status == ArtifactStatus(status))
-
-            query = query.order_by(ArtifactModel.created_at.desc())
-            query = query.offset(offset).limit(limit)
-
-            return [artifact.to_manifest() for artifact in query.all()]
+        # Core select of table columns: rows are plain tuples, no ORM
+        # instances or identity-map entries
+        table = ArtifactModel.__table__
+        stmt = select(table)
+
+        if trace_id:
+            stmt = stmt.where(table.c.trace_id == trace_id)
+        if created_by:
+            stmt = stmt.where(table.c.created_by == created_by)
+        if artifact_type:
+            stmt = stmt.where(table.c.artifact_type == artifact_type)
+        if status:
+            stmt = stmt.where(table.c.status == ArtifactStatus(status))
+
+        stmt = stmt.order_by(table.c.created_at.desc()).offset(offset).limit(limit)
+
+        row_to_manifest = ArtifactModel.row_to_manifest
+        with self._session(session) as session:
+            result = session.execute(stmt).yield_per(LIST_FETCH_BATCH_SIZE)
+            return [row_to_manifest(row) for row in result]
 
     # =========================================================================
     # Artifact Versioning
@@ -413,6 +820,7 @@ class PersistentStorageService:
         created_by: str,
         filename: str,
         context: Optional[Dict[str, Any]] = None,
+        session: Optional[Session] = None,
     ) -> ArtifactManifest:
         """
         Create new version of existing artifact.
@@ -423,12 +831,13 @@ class PersistentStorageService:
             created_by: Creator of new version
             filename: New filename
             context: Optional AI context
+            session: Optional session for the lookup (see session_scope)
 
         Returns:
             New ArtifactManifest with incremented version
         """
         # Get existing artifact
-        existing = self.get_artifact(artifact_id)
+        existing = self.get_artifact(artifact_id, session)
         if existing is None:
             raise FileNotFoundError(f"Artifact not found: {artifact_id}")
 
@@ -449,17 +858,18 @@ class PersistentStorageService:
     # Checksum Verification
     # =========================================================================
 
-    def verify_artifact(self, artifact_id: str) -> bool:
+    def verify_artifact(self, artifact_id: str, session: Optional[Session] = None) -> bool:
         """
         Verify artifact checksum.
 
         Args:
             artifact_id: Artifact ID
+            session: Optional session to reuse (see session_scope)
 
         Returns:
             True if checksum matches
         """
-        manifest = self.get_artifact(artifact_id)
+        manifest = self.get_artifact(artifact_id, session)
         if manifest is None:
             raise FileNotFoundError(f"Artifact not found: {artifact_id}")
 
@@ -493,33 +903,41 @@ class PersistentStorageService:
         logger.info(f"Cleaned {cleaned} temp files older than {older_than_hours}h")
         return cleaned
 
-    def delete_artifact(self, artifact_id: str) -> bool:
+    def delete_artifact(self, artifact_id: str, session: Optional[Session] = None) -> bool:
         """
         Delete artifact (soft delete — moves file to orphans).
 
         Args:
             artifact_id: Artifact ID
+            session: Optional session to reuse (see session_scope)
 
         Returns:
             True if deleted
         """
-        with self.SessionLocal() as session:
-            db_artifact = session.query(ArtifactModel).filter(
-                ArtifactModel.id == artifact_id
-            ).first()
-
-            if db_artifact is None:
+        owns_session = session is None
+        with self._session(session) as session:
+            # Remove from database; RETURNING gives the URI in the same round trip
+            uri = session.execute(
+                delete(ArtifactModel)
+                .where(ArtifactModel.id == artifact_id)
+                .returning(ArtifactModel.uri)
+            ).scalar_one_or_none()
+
+            if uri is None:
                 return False
 
             # Move file to orphans
             try:
-                self.file_storage.move_to_orphans(db_artifact.uri)
+                self.file_storage.move_to_orphans(uri)
             except FileNotFoundError:
                 logger.warning(f"File not found for artifact {artifact_id}, removing metadata only")
 
-            # Remove from database
-            session.delete(db_artifact)
-            session.commit()
+            # A caller's session (session_scope) commits with its command
+            if owns_session:
+                session.commit()
+            else:
+                session.flush()
+            self._invalidate_manifest(artifact_id)
 
             logger.info(f"Deleted artifact: {artifact_id}")
             return True
@@ -528,37 +946,34 @@ class PersistentStorageService:
     # Statistics
     # =========================================================================
 
-    def get_stats(self) -> Dict[str, Any]:
+    def get_stats(self, session: Optional[Session] = None) -> Dict[str, Any]:
         """
         Get storage statistics.
 
+        Args:
+            session: Optional session to reuse (see session_scope)
+
         Returns:
             Dictionary with storage stats
         """
-        with self.SessionLocal() as session:
-            total = session.query(ArtifactModel).count()
-            completed = session.query(ArtifactModel).filter(
-                ArtifactModel.status == ArtifactStatus.COMPLETED
-            ).count()
-            failed = session.query(ArtifactModel).filter(
-                ArtifactModel.status == ArtifactStatus.FAILED
-            ).count()
-            uploading = session.query(ArtifactModel).filter(
-                ArtifactModel.status == ArtifactStatus.UPLOADING
-            ).count()
+        # One GROUP BY instead of a COUNT per status
+        with self._session(session) as session:
+            by_status = dict(session.execute(
+                select(ArtifactModel.status, func.count()).group_by(ArtifactModel.status)
+            ).all())
 
         file_stats = self.file_storage.get_stats()
 
         return {
             "artifacts": {
-                "total": total,
-                "completed": completed,
-                "failed": failed,
-                "uploading": uploading,
+                "total": sum(by_status.values()),
+                "completed": by_status.get(ArtifactStatus.COMPLETED, 0),
+                "failed": by_status.get(ArtifactStatus.FAILED, 0),
+                "uploading": by_status.get(ArtifactStatus.UPLOADING, 0),
             },
             "files": file_stats,
             "buffer": {
-                "count": len(self.file_storage.list_buffered_artifacts()),
+                "count": len(self._buffer_index),
                 "max_items": self.buffer_max_items,
                 "max_size_mb": self.buffer_max_size_mb,
             },
@@ -616,9 +1031,11 @@ class StorageServiceHandler:
         if handler is None:
             raise ValueError(f"Unknown action: {action}. Supported: {list(handlers.keys())}")
 
-        return handler(params)
+        # One session (connection checkout, transaction) per command
+        with self.storage.session_scope() as session:
+            return handler(params, session)
 
-    def _register_artifact(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _register_artifact(self, params: Dict[str, Any], session: Session) -> Dict[str, Any]:
         """Register new artifact."""
         required = ["content", "artifact_type", "trace_id", "created_by", "filename"]
         for field in required:
@@ -628,8 +1045,7 @@ class StorageServiceHandler:
         # Content can be base64 encoded string or bytes
         content = params["content"]
         if isinstance(content, str):
-            import base64
-            content = base64.b64decode(content)
+            content = binascii.a2b_base64(content)
 
         manifest = self.storage.register_artifact(
             content=content,
@@ -652,13 +1068,14 @@ class StorageServiceHandler:
             "manifest": manifest.model_dump(mode="json"),
         }
 
-    def _get_artifact(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _get_artifact(self, params: Dict[str, Any], session: Session) -> Dict[str, Any]:
         """Get artifact manifest."""
         artifact_id = params.get("artifact_id")
         if not artifact_id:
             raise ValueError("Missing required parameter: artifact_id")
+        validate_artifact_id(artifact_id)
 
-        manifest = self.storage.get_artifact(artifact_id)
+        manifest = self.storage.get_artifact(artifact_id, session)
         if manifest is None:
             raise FileNotFoundError(f"Artifact not found: {artifact_id}")
 
@@ -669,24 +1086,27 @@ class StorageServiceHandler:
             "manifest": manifest.model_dump(mode="json"),
         }
 
-    def _get_artifact_content(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _get_artifact_content(self, params: Dict[str, Any], session: Session) -> Dict[str, Any]:
         """Get artifact content."""
         artifact_id = params.get("artifact_id")
         if not artifact_id:
             raise ValueError("Missing required parameter: artifact_id")
+        validate_artifact_id(artifact_id)
 
-        import base64
-        content = self.storage.get_artifact_content(artifact_id)
+        # Encode straight from the mapped file, no intermediate bytes copy
+        with self.storage.open_artifact_content(artifact_id, session) as content:
+            encoded = _b64encode_chunked(content)
+            size_bytes = len(content)
 
         return {
             "action": "get_artifact_content",
             "status": "completed",
             "artifact_id": artifact_id,
-            "content": base64.b64encode(content).decode("utf-8"),
-            "size_bytes": len(content),
+            "content": encoded,
+            "size_bytes": size_bytes,
         }
 
-    def _list_artifacts(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _list_artifacts(self, params: Dict[str, Any], session: Session) -> Dict[str, Any]:
         """List artifacts."""
         artifacts = self.storage.list_artifacts(
             trace_id=params.get("trace_id"),
@@ -695,22 +1115,24 @@ class StorageServiceHandler:
             status=params.get("status"),
             limit=params.get("limit", 100),
             offset=params.get("offset", 0),
+            session=session,
         )
 
         return {
             "action": "list_artifacts",
             "status": "completed",
             "count": len(artifacts),
-            "artifacts": [a.model_dump(mode="json") for a in artifacts],
+            "artifacts": _MANIFEST_LIST_ADAPTER.dump_python(artifacts, mode="json"),
         }
 
-    def _verify_artifact(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _verify_artifact(self, params: Dict[str, Any], session: Session) -> Dict[str, Any]:
         """Verify artifact checksum."""
         artifact_id = params.get("artifact_id")
         if not artifact_id:
             raise ValueError("Missing required parameter: artifact_id")
+        validate_artifact_id(artifact_id)
 
-        is_valid = self.storage.verify_artifact(artifact_id)
+        is_valid = self.storage.verify_artifact(artifact_id, session)
 
         return {
             "action": "verify_artifact",
@@ -719,13 +1141,14 @@ class StorageServiceHandler:
             "checksum_valid": is_valid,
         }
 
-    def _delete_artifact(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _delete_artifact(self, params: Dict[str, Any], session: Session) -> Dict[str, Any]:
         """Delete artifact."""
         artifact_id = params.get("artifact_id")
         if not artifact_id:
             raise ValueError("Missing required parameter: artifact_id")
+        validate_artifact_id(artifact_id)
 
-        deleted = self.storage.delete_artifact(artifact_id)
+        deleted = self.storage.delete_artifact(artifact_id, session)
 
         return {
             "action": "delete_artifact",
@@ -734,7 +1157,7 @@ class StorageServiceHandler:
             "deleted": deleted,
         }
 
-    def _create_new_version(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _create_new_version(self, params: Dict[str, Any], session: Session) -> Dict[str, Any]:
         """Create new version of artifact."""
         required = ["artifact_id", "content", "created_by", "filename"]
         for field in required:
@@ -743,15 +1166,15 @@ class StorageServiceHandler:
 
         content = params["content"]
         if isinstance(content, str):
-            import base64
-            content = base64.b64decode(content)
+            content = binascii.a2b_base64(content)
 
         manifest = self.storage.create_new_version(
-            artifact_id=params["artifact_id"],
+            artifact_id=validate_artifact_id(params["artifact_id"]),
             content=content,
             created_by=params["created_by"],
             filename=params["filename"],
             context=params.get("context"),
+            session=session,
         )
 
         return {
@@ -763,9 +1186,9 @@ class StorageServiceHandler:
             "manifest": manifest.model_dump(mode="json"),
         }
 
-    def _get_stats(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _get_stats(self, params: Dict[str, Any], session: Session) -> Dict[str, Any]:
         """Get storage statistics."""
-        stats = self.storage.get_stats()
+        stats = self.storage.get_stats(session)
 
         return {
             "action": "get_stats",
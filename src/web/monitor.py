@@ -16,27 +16,39 @@ See: docs/SSOT/AGENT_SPEC_v1.0.md
 """
 
 import asyncio
+import functools
+import itertools
 import json
 import logging
 import os
 import threading
 import time
 import uuid
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Set, Union
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
-from fastapi.responses import HTMLResponse, JSONResponse
+from starlette.websockets import WebSocketState
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 import uvicorn
-import yaml
+from pika.exceptions import AMQPChannelError, AMQPConnectionError
+
+try:
+    import uvloop  # noqa: F401  optional libuv-based event loop
+    EVENT_LOOP = "uvloop"
+except ImportError:
+    EVENT_LOOP = "asyncio"
 
 # Add project root to path
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.mindbus.core import MindBus
+from src.yaml_config import load_yaml_file
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -47,31 +59,69 @@ logger = logging.getLogger(__name__)
 
 app = FastAPI(title="AI_TEAM Monitor", version="1.0.0")
 
+# Messages kept per agent (oldest dropped first)
+AGENT_MESSAGE_HISTORY = 1000
+
 # Initialize agents on module load (for both runtime and testing)
 _initialized = False
 
 # In-memory storage for agents and messages
 registered_agents: Dict[str, Dict[str, Any]] = {}
-agent_messages: Dict[str, List[Dict[str, Any]]] = {}  # agent_name -> messages
+agent_messages: Dict[str, Deque[Dict[str, Any]]] = defaultdict(
+    lambda: deque(maxlen=AGENT_MESSAGE_HISTORY)
+)  # agent_name -> most recent messages
 pending_responses: Dict[str, asyncio.Future] = {}  # correlation_id -> future
-processed_message_ids: set = set()  # Deduplication: track processed message IDs
+# Serialized /api/agents body, valid while its version matches agents_version
+agents_version = 0
+_agents_cache: Optional[tuple] = None  # (agents_version, body bytes)
+processed_message_ids: "OrderedDict[str, None]" = OrderedDict()  # Deduplication: recent message IDs (FIFO)
 
 # WebSocket connections for live updates
-ws_connections: List[WebSocket] = []
+ws_connections: Set[WebSocket] = set()
 
 # MindBus connections (separate for thread safety)
 bus_listener: Optional[MindBus] = None  # For receiving events (runs in background thread)
 bus_sender: Optional[MindBus] = None    # For sending commands (used from API endpoints)
 bus_thread: Optional[threading.Thread] = None
 
+sender_lock = threading.Lock()  # pika connections are not thread-safe
+keepalive_task: Optional[asyncio.Task] = None
+
+# FastAPI event loop; bus callbacks (background thread) schedule broadcasts on it
+main_loop: Optional[asyncio.AbstractEventLoop] = None
+
 # Fixed reply queue for RPC responses
 MONITOR_REPLY_QUEUE = "monitor.replies"
 
+# Max message IDs remembered for RESULT/ERROR deduplication (oldest evicted)
+PROCESSED_IDS_CAPACITY = 10000
+
+# Seconds between sender keepalives (services AMQP heartbeats, detects drops)
+SENDER_KEEPALIVE_SECONDS = 30
+
+# Max seconds a single WebSocket send may take during a broadcast
+BROADCAST_SEND_TIMEOUT = 5.0
+
+# Clients per send batch when broadcasting to many WebSockets
+BROADCAST_BATCH_SIZE = 50
+
 
 # =============================================================================
 # Agent Registry (load from config files)
 # =============================================================================
 
+# Threads reading agent config files in parallel at startup
+CONFIG_LOAD_WORKERS = 8
+
+
+def _try_parse(path: Path) -> tuple:
+    """Parse one config file for the loader pool: (config, None) or (None, error)."""
+    try:
+        return load_yaml_file(path), None
+    except Exception as e:
+        return None, e
+
+
 def load_agents_from_config() -> Dict[str, Dict[str, Any]]:
     """Load agent configurations from config/agents/*.yaml"""
     agents = {}
@@ -81,10 +131,15 @@ def load_agents_from_config() -> Dict[str, Dict[str, Any]]:
         logger.warning(f"Config directory not found: {config_dir}")
         return agents
 
-    for config_file in config_dir.glob("*.yaml"):
+    # Read and parse files in parallel; build entries in file order below
+    files = list(config_dir.glob("*.yaml"))
+    with ThreadPoolExecutor(max_workers=CONFIG_LOAD_WORKERS) as pool:
+        parsed = list(pool.map(_try_parse, files))
+
+    for config_file, (config, error) in zip(files, parsed):
         try:
-            with open(config_file) as f:
-                config = yaml.safe_load(f)
+            if error is not None:
+                raise error
 
             # Extract agent config (handle nested structure)
             if len(config) == 1:
@@ -125,12 +180,19 @@ def load_agents_from_config() -> Dict[str, Dict[str, Any]]:
     return agents
 
 
+def invalidate_agents_cache() -> None:
+    """Mark the /api/agents response stale after registered_agents changes."""
+    global agents_version
+    agents_version += 1
+
+
 def initialize_agents():
     """Initialize agents from config files."""
     global registered_agents, _initialized
     if _initialized:
         return
     registered_agents = load_agents_from_config()
+    invalidate_agents_cache()
     _initialized = True
     logger.info(f"Loaded {len(registered_agents)} agent configurations")
 
@@ -163,14 +225,11 @@ def on_event(event: dict, data: dict) -> None:
             registered_agents[node_name]["status"] = "online"
             registered_agents[node_name]["last_heartbeat"] = datetime.utcnow().isoformat()
             registered_agents[node_name]["passport"] = event_data.get("passport", {})
+            invalidate_agents_cache()
             logger.info(f"Agent registered: {node_name}")
 
             # Notify WebSocket clients
-            asyncio.run(broadcast_update({
-                "type": "agent_status",
-                "agent": node_name,
-                "status": "online"
-            }))
+            schedule_broadcast(_status_msg(node_name, "online"))
 
     elif "node.heartbeat" in event_type:
         # Agent heartbeat - data is in event_data
@@ -183,6 +242,7 @@ def on_event(event: dict, data: dict) -> None:
             if current_status != "working":
                 registered_agents[node_name]["status"] = "online"
             registered_agents[node_name]["last_heartbeat"] = datetime.utcnow().isoformat()
+            invalidate_agents_cache()
 
     elif "node.deregistered" in event_type:
         # Agent deregistered - data is in event_data
@@ -190,6 +250,7 @@ def on_event(event: dict, data: dict) -> None:
         node_name = event_data.get("name", "")
         if node_name and node_name in registered_agents:
             registered_agents[node_name]["status"] = "offline"
+            invalidate_agents_cache()
             logger.info(f"Agent deregistered: {node_name}")
 
 
@@ -206,15 +267,27 @@ def on_task_event(event: dict, data: dict) -> None:
         if source and source in registered_agents:
             if state == "working":
                 registered_agents[source]["status"] = "working"
+                invalidate_agents_cache()
                 # Broadcast status change to WebSocket clients
-                asyncio.run(broadcast_update({
-                    "type": "agent_status",
-                    "agent": source,
-                    "status": "working"
-                }))
+                schedule_broadcast(_status_msg(source, "working"))
                 logger.info(f"Agent {source} is working (task.progress received)")
 
 
+def _dedup(message_id: str) -> bool:
+    """
+    Record a RESULT/ERROR message ID for deduplication.
+
+    Returns:
+        True if the ID was already processed (the message is a duplicate)
+    """
+    if message_id in processed_message_ids:
+        return True
+    processed_message_ids[message_id] = None
+    if len(processed_message_ids) > PROCESSED_IDS_CAPACITY:
+        processed_message_ids.popitem(last=False)
+    return False
+
+
 def on_result(event: dict, data: dict) -> None:
     """Handle incoming RESULT messages."""
     message_id = event.get("id")
@@ -222,11 +295,9 @@ def on_result(event: dict, data: dict) -> None:
     source = event.get("source", "unknown")
 
     # Deduplication: skip if already processed
-    if message_id and message_id in processed_message_ids:
+    if message_id and _dedup(message_id):
         logger.debug(f"Skipping duplicate RESULT message: {message_id}")
         return
-    if message_id:
-        processed_message_ids.add(message_id)
 
     message = {
         "id": message_id,
@@ -237,8 +308,6 @@ def on_result(event: dict, data: dict) -> None:
     }
 
     # Store in message history
-    if source not in agent_messages:
-        agent_messages[source] = []
     agent_messages[source].append(message)
 
     # Resolve pending future if exists
@@ -252,19 +321,15 @@ def on_result(event: dict, data: dict) -> None:
     # Set agent status back to "online" after processing
     if source in registered_agents:
         registered_agents[source]["status"] = "online"
+        invalidate_agents_cache()
 
-    # Broadcast to WebSocket clients
-    asyncio.run(broadcast_update({
-        "type": "message",
+    # Broadcast message and status change to WebSocket clients in one frame
+    schedule_broadcast({
+        "type": "result_update",
         "agent": source,
+        "status": "online",
         "message": message
-    }))
-    # Also broadcast status change
-    asyncio.run(broadcast_update({
-        "type": "agent_status",
-        "agent": source,
-        "status": "online"
-    }))
+    })
 
 
 def on_error(event: dict, data: dict) -> None:
@@ -274,11 +339,9 @@ def on_error(event: dict, data: dict) -> None:
     source = event.get("source", "unknown")
 
     # Deduplication: skip if already processed
-    if message_id and message_id in processed_message_ids:
+    if message_id and _dedup(message_id):
         logger.debug(f"Skipping duplicate ERROR message: {message_id}")
         return
-    if message_id:
-        processed_message_ids.add(message_id)
 
     message = {
         "id": event.get("id"),
@@ -289,8 +352,6 @@ def on_error(event: dict, data: dict) -> None:
     }
 
     # Store in message history
-    if source not in agent_messages:
-        agent_messages[source] = []
     agent_messages[source].append(message)
 
     # Resolve pending future if exists
@@ -304,28 +365,44 @@ def on_error(event: dict, data: dict) -> None:
     # Set agent status back to "online" after processing (even on error)
     if source in registered_agents:
         registered_agents[source]["status"] = "online"
+        invalidate_agents_cache()
 
-    # Broadcast to WebSocket clients
-    asyncio.run(broadcast_update({
-        "type": "message",
+    # Broadcast message and status change to WebSocket clients in one frame
+    schedule_broadcast({
+        "type": "result_update",
         "agent": source,
+        "status": "online",
         "message": message
-    }))
-    # Also broadcast status change
-    asyncio.run(broadcast_update({
-        "type": "agent_status",
-        "agent": source,
-        "status": "online"
-    }))
+    })
+
+
+@functools.lru_cache(maxsize=256)
+def _status_msg(agent: str, status: str) -> str:
+    """Serialized agent_status update; these repeat constantly, so cache them."""
+    return json.dumps({"type": "agent_status", "agent": agent, "status": status})
+
+
+def schedule_broadcast(data: Union[dict, str]) -> None:
+    """
+    Broadcast from the bus thread: hand the coroutine to the FastAPI loop.
+
+    Fire-and-forget; dropped if the server loop is not running yet.
+    """
+    loop = main_loop
+    if loop is None or loop.is_closed():
+        return
+    asyncio.run_coroutine_threadsafe(broadcast_update(data), loop)
 
 
 def start_bus_connections():
     """Start MindBus connections - separate for sending and receiving (thread safety)."""
-    global bus_listener, bus_sender, bus_thread
+    global bus_listener, bus_thread, main_loop
+
+    # Called from the startup handler: remember the server loop for broadcasts
+    main_loop = asyncio.get_running_loop()
 
     # Sender connection - used from API endpoints (main thread)
-    bus_sender = MindBus()
-    bus_sender.connect()
+    connect_sender()
     logger.info("MindBus sender connection established")
 
     # Listener connection - used in background thread
@@ -357,26 +434,74 @@ def start_bus_connections():
 # WebSocket for Live Updates
 # =============================================================================
 
-async def broadcast_update(data: dict):
-    """Broadcast update to all connected WebSocket clients."""
-    message = json.dumps(data)
-    disconnected = []
+async def broadcast_update(data: Union[dict, str]):
+    """
+    Broadcast update to all connected WebSocket clients.
 
-    for ws in ws_connections:
+    Accepts the update as a dict or as already-serialized JSON.
+
+    Sends run concurrently, each bounded by BROADCAST_SEND_TIMEOUT, so one
+    slow client does not hold up the others. Failed clients are dropped
+    and closed.
+    Above BROADCAST_BATCH_SIZE clients, sends go out in batches with a
+    yield to the event loop in between.
+    """
+    message = data if isinstance(data, str) else json.dumps(data)
+
+    async def safe_send(ws: WebSocket) -> bool:
+        # Clients no longer connected are dropped (and closed) without a send
+        if ws.client_state != WebSocketState.CONNECTED:
+            return False
         try:
-            await ws.send_text(message)
-        except:
-            disconnected.append(ws)
+            await asyncio.wait_for(ws.send_text(message), timeout=BROADCAST_SEND_TIMEOUT)
+            return True
+        except (WebSocketDisconnect, RuntimeError, OSError, asyncio.TimeoutError):
+            # Disconnected, closed under us, broken transport, or too slow
+            return False
+        except Exception as e:
+            logger.warning(f"Dropping WebSocket client after send error: {e!r}")
+            return False
 
-    for ws in disconnected:
-        ws_connections.remove(ws)
+    clients = list(ws_connections)
+    if len(clients) <= BROADCAST_BATCH_SIZE:
+        sent = await asyncio.gather(*(safe_send(ws) for ws in clients))
+    else:
+        sent = []
+        for start in range(0, len(clients), BROADCAST_BATCH_SIZE):
+            batch = clients[start:start + BROADCAST_BATCH_SIZE]
+            sent.extend(await asyncio.gather(*(safe_send(ws) for ws in batch)))
+            # Let other handlers run between batches
+            await asyncio.sleep(0)
+
+    dropped = [ws for ws, ok in zip(clients, sent) if not ok]
+    for ws in dropped:
+        ws_connections.discard(ws)
+    if dropped:
+        await asyncio.gather(*(close_dropped_client(ws) for ws in dropped))
+
+
+async def close_dropped_client(ws: WebSocket) -> None:
+    """
+    Close a client dropped from broadcasts so the page reconnects.
+
+    Otherwise its endpoint keeps the socket open in receive_text and the
+    browser silently stops getting updates. A send cancelled by the timeout
+    may have left a partial frame, so the connection cannot be reused.
+    """
+    # Already closed from our side (e.g. by its endpoint): nothing to do
+    if ws.application_state == WebSocketState.DISCONNECTED:
+        return
+    try:
+        await asyncio.wait_for(ws.close(code=1011), timeout=BROADCAST_SEND_TIMEOUT)
+    except (RuntimeError, OSError, asyncio.TimeoutError) as e:
+        logger.debug(f"Closing dropped WebSocket client failed: {e!r}")
 
 
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for live updates."""
     await websocket.accept()
-    ws_connections.append(websocket)
+    ws_connections.add(websocket)
     logger.info("WebSocket client connected")
 
     try:
@@ -385,7 +510,7 @@ async def websocket_endpoint(websocket: WebSocket):
             data = await websocket.receive_text()
             # Could handle client commands here
     except WebSocketDisconnect:
-        ws_connections.remove(websocket)
+        ws_connections.discard(websocket)
         logger.info("WebSocket client disconnected")
 
 
@@ -393,9 +518,26 @@ async def websocket_endpoint(websocket: WebSocket):
 # REST API Endpoints
 # =============================================================================
 
+def recent_messages(agent_name: str, limit: int) -> List[Dict[str, Any]]:
+    """Return up to the last `limit` messages for an agent, oldest first."""
+    messages = agent_messages.get(agent_name)
+    if not messages or limit <= 0:
+        return []
+    # Walk from the newest end so the cost is O(limit), not O(history)
+    recent = list(itertools.islice(reversed(messages), limit))
+    recent.reverse()
+    return recent
+
+
 @app.get("/api/agents")
 async def get_agents():
-    """Get list of all agents."""
+    """Get list of all agents (serialized once per state change)."""
+    global _agents_cache
+    version = agents_version
+    cached = _agents_cache
+    if cached is not None and cached[0] == version:
+        return Response(content=cached[1], media_type="application/json")
+
     agents_list = []
     for name, agent in registered_agents.items():
         agents_list.append({
@@ -407,7 +549,11 @@ async def get_agents():
             "status": agent.get("status", "offline"),
             "last_heartbeat": agent.get("last_heartbeat"),
         })
-    return JSONResponse(agents_list)
+    response = JSONResponse(agents_list)
+    # Tagged with the version read before building: a bus-thread change
+    # made meanwhile bumps agents_version, so the next GET rebuilds
+    _agents_cache = (version, response.body)
+    return response
 
 
 @app.get("/api/agents/{agent_name}")
@@ -419,35 +565,40 @@ async def get_agent(agent_name: str):
     agent = registered_agents[agent_name]
     return JSONResponse({
         **agent,
-        "messages": agent_messages.get(agent_name, [])[-50:],  # Last 50 messages
+        "messages": recent_messages(agent_name, 50),  # Last 50 messages
     })
 
 
-def ensure_sender_connected():
-    """Ensure bus_sender is connected, reconnect if needed."""
+def connect_sender() -> None:
+    """Open a new bus_sender connection."""
     global bus_sender
 
-    needs_reconnect = False
-
-    if bus_sender is None:
-        needs_reconnect = True
-    elif not bus_sender._connection:
-        needs_reconnect = True
-    elif bus_sender._connection.is_closed:
-        needs_reconnect = True
-    elif not bus_sender._channel:
-        needs_reconnect = True
-    elif bus_sender._channel.is_closed:
-        needs_reconnect = True
-    else:
-        # Additional check: try to verify connection is actually alive
-        try:
-            # This will raise if connection is dead
-            bus_sender._connection.process_data_events(time_limit=0)
-        except Exception:
-            needs_reconnect = True
+    bus_sender = MindBus()
+    bus_sender.connect()
+
+
+def _sender_is_open() -> bool:
+    """Whether bus_sender's connection and channel are open (no I/O)."""
+    return (
+        bus_sender is not None
+        and bus_sender._connection is not None
+        and bus_sender._connection.is_open
+        and bus_sender._channel is not None
+        and bus_sender._channel.is_open
+    )
+
+
+def ensure_sender_connected():
+    """
+    Ensure bus_sender is connected, reconnect if needed.
+
+    Checks pika's connection state instead of probing the broker; drops
+    are noticed whenever pika processes I/O (sends or keepalives).
+    """
+    with sender_lock:
+        if _sender_is_open():
+            return
 
-    if needs_reconnect:
         logger.info("Reconnecting bus_sender...")
         try:
             # Close old connection if exists
@@ -457,14 +608,53 @@ def ensure_sender_connected():
                 except Exception:
                     pass
 
-            bus_sender = MindBus()
-            bus_sender.connect()
+            connect_sender()
             logger.info("bus_sender reconnected successfully")
         except Exception as e:
             logger.error(f"Failed to reconnect bus_sender: {e}")
             raise
 
 
+def publish_command(**kwargs) -> None:
+    """
+    Send a COMMAND through bus_sender (blocking; call via asyncio.to_thread).
+
+    A connection found dead while sending is reopened and the send retried
+    once.
+    """
+    try:
+        with sender_lock:
+            bus_sender.send_command(**kwargs)
+        return
+    except (AMQPConnectionError, AMQPChannelError) as e:
+        logger.warning(f"bus_sender lost its connection, retrying: {e}")
+
+    ensure_sender_connected()
+    with sender_lock:
+        bus_sender.send_command(**kwargs)
+
+
+def _sender_keepalive_tick() -> None:
+    """Let pika service heartbeats on the idle sender, then reconnect if it dropped."""
+    with sender_lock:
+        if _sender_is_open():
+            try:
+                bus_sender._connection.process_data_events(time_limit=0)
+            except (AMQPConnectionError, AMQPChannelError) as e:
+                logger.warning(f"bus_sender connection dropped: {e}")
+    ensure_sender_connected()
+
+
+async def sender_keepalive() -> None:
+    """Background task: run the sender keepalive every SENDER_KEEPALIVE_SECONDS."""
+    while True:
+        await asyncio.sleep(SENDER_KEEPALIVE_SECONDS)
+        try:
+            await asyncio.to_thread(_sender_keepalive_tick)
+        except Exception as e:
+            logger.warning(f"Sender keepalive failed: {e}")
+
+
 @app.post("/api/agents/{agent_name}/command")
 async def send_command(agent_name: str, command: dict):
     """Send COMMAND to agent."""
@@ -472,7 +662,7 @@ async def send_command(agent_name: str, command: dict):
         return JSONResponse({"error": "Agent not found"}, status_code=404)
 
     try:
-        ensure_sender_connected()
+        await asyncio.to_thread(ensure_sender_connected)
     except Exception as e:
         return JSONResponse({"error": f"MindBus connection failed: {e}"}, status_code=503)
 
@@ -501,8 +691,6 @@ async def send_command(agent_name: str, command: dict):
         }
     }
 
-    if agent_name not in agent_messages:
-        agent_messages[agent_name] = []
     agent_messages[agent_name].append(outgoing_message)
 
     # Send command via MindBus
@@ -511,7 +699,9 @@ async def send_command(agent_name: str, command: dict):
         agent_type = registered_agents.get(agent_name, {}).get("type", "agent")
         target = f"{agent_type}.task"
 
-        bus_sender.send_command(
+        # Blocking AMQP publish: run it off the event loop
+        await asyncio.to_thread(
+            publish_command,
             action=action,
             params=params,
             target=target,
@@ -526,12 +716,9 @@ async def send_command(agent_name: str, command: dict):
         # Set agent status to "working" while processing
         if agent_name in registered_agents:
             registered_agents[agent_name]["status"] = "working"
+            invalidate_agents_cache()
             # Broadcast status change to WebSocket clients
-            asyncio.create_task(broadcast_update({
-                "type": "agent_status",
-                "agent": agent_name,
-                "status": "working"
-            }))
+            asyncio.create_task(broadcast_update(_status_msg(agent_name, "working")))
 
         return JSONResponse({
             "success": True,
@@ -547,8 +734,7 @@ async def send_command(agent_name: str, command: dict):
 @app.get("/api/agents/{agent_name}/messages")
 async def get_messages(agent_name: str, limit: int = 50):
     """Get message history for agent."""
-    messages = agent_messages.get(agent_name, [])
-    return JSONResponse(messages[-limit:])
+    return JSONResponse(recent_messages(agent_name, limit))
 
 
 # =============================================================================
@@ -727,7 +913,7 @@ def get_index_html() -> str:
 
             ws.onmessage = (event) => {
                 const data = JSON.parse(event.data);
-                if (data.type === 'agent_status') {
+                if (data.type === 'agent_status' || data.type === 'result_update') {
                     loadAgents();
                 }
             };
@@ -1160,8 +1346,8 @@ def get_agent_html(agent_name: str) -> str:
 
             ws.onmessage = (event) => {{
                 const data = JSON.parse(event.data);
-                if (data.type === 'message' && data.agent === agentName) {{
-                    loadAgent();  // Refresh messages
+                if (data.type === 'result_update' && data.agent === agentName) {{
+                    loadAgent();  // Refresh messages and status
                 }}
                 if (data.type === 'agent_status' && data.agent === agentName) {{
                     loadAgent();  // Refresh status
@@ -1195,14 +1381,18 @@ def get_agent_html(agent_name: str) -> str:
 @app.on_event("startup")
 async def startup():
     """Initialize on startup."""
+    global keepalive_task
     initialize_agents()
     start_bus_connections()
+    keepalive_task = asyncio.create_task(sender_keepalive())
 
 
 @app.on_event("shutdown")
 async def shutdown():
     """Cleanup on shutdown."""
     global bus_listener, bus_sender
+    if keepalive_task:
+        keepalive_task.cancel()
     if bus_listener:
         bus_listener.stop_consuming()
         bus_listener.disconnect()
@@ -1221,9 +1411,10 @@ def main():
     print("="*60)
     print("\nStarting web server...")
     print("Open http://localhost:8080 in your browser")
+    print(f"Event loop: {EVENT_LOOP}")
     print("\nPress Ctrl+C to stop\n")
 
-    uvicorn.run(app, host="0.0.0.0", port=8080, log_level="info")
+    uvicorn.run(app, host="0.0.0.0", port=8080, log_level="info", loop=EVENT_LOOP)
 
 
 if __name__ == "__main__":
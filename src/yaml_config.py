@@ -0,0 +1,121 @@
+"""
+YAML config loading shared by services, the registry and the web monitor.
+
+Each file is parsed at most once per (path, mtime, size): service
+restarts, tests and the monitor's reloads construct many readers of the
+same files, and the stat key makes edits take effect.
+
+Parsing uses the libyaml-backed CSafeLoader when PyYAML was built with it,
+falling back to the pure-Python SafeLoader. yaml itself is imported on
+first use, so importing this module stays cheap.
+"""
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Parsed-config sidecar written next to a YAML file (see load_yaml_file)
+CONFIG_CACHE_SUFFIX = ".cache.json"
+
+_yaml_fallback_warned = False
+
+
+def _load_yaml(raw: bytes) -> Any:
+    """Parse YAML with the fastest available safe loader."""
+    global _yaml_fallback_warned
+    import yaml  # deferred: only needed when a config file is parsed
+
+    loader = getattr(yaml, "CSafeLoader", None)
+    if loader is None:
+        loader = yaml.SafeLoader
+        if not _yaml_fallback_warned:
+            _yaml_fallback_warned = True
+            logger.warning(
+                "PyYAML built without libyaml: config parsing uses the "
+                "slow pure-Python SafeLoader"
+            )
+
+    # Bytes in: libyaml decodes UTF-8 itself
+    return yaml.load(raw, Loader=loader)
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_yaml(path: str, mtime_ns: int, size: int, sidecar: bool = False) -> Any:
+    """Parse a YAML file once per (path, mtime, size)."""
+    with open(path, "rb") as f:
+        raw = f.read()
+
+    if not sidecar or os.environ.get("AI_TEAM_NO_CONFIG_CACHE"):
+        return _load_yaml(raw)
+
+    # JSON sidecar from a previous start, valid only for identical YAML bytes
+    digest = hashlib.sha256(raw).hexdigest()
+    cache_path = path + CONFIG_CACHE_SUFFIX
+    try:
+        with open(cache_path, "rb") as f:
+            cached = json.loads(f.read())
+        if cached.get("sha256") == digest:
+            return cached["config"]
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable config cache {cache_path}: {e}")
+
+    config = _load_yaml(raw)
+    _write_config_cache(cache_path, digest, config)
+    return config
+
+
+def _write_config_cache(cache_path: str, digest: str, config: Any) -> None:
+    """
+    Atomically write the parsed config as JSON next to its YAML source.
+
+    Skipped when JSON cannot represent the config exactly (dates,
+    non-string keys): the sidecar must load back to an equal value.
+    """
+    try:
+        payload = json.dumps({"sha256": digest, "config": config})
+        if json.loads(payload)["config"] != config:
+            return
+    except (TypeError, ValueError):
+        return
+
+    try:
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(cache_path), prefix=".config-", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(payload)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        # Read-only config dir etc. — caching is best-effort
+        logger.debug(f"Could not write config cache {cache_path}: {e}")
+
+
+def load_yaml_file(path: "str | os.PathLike", sidecar: bool = False) -> Any:
+    """
+    Load a YAML file, parsing it at most once per modification.
+
+    Args:
+        path: Path to the YAML file
+        sidecar: Also keep the parsed result as JSON next to the file
+            (CONFIG_CACHE_SUFFIX), so a fresh process skips YAML parsing
+            when the file bytes are unchanged
+
+    Returns:
+        The parsed document. It is shared by all callers and must not be
+        mutated; deep-copy it first if needed.
+    """
+    resolved = os.path.abspath(path)
+    st = os.stat(resolved)
+    return _parse_yaml(resolved, st.st_mtime_ns, st.st_size, sidecar)
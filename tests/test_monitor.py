@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Tests for the Monitor web interface.
+
+Tests WebSocket broadcast behaviour of src/web/monitor.py.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+pytest.importorskip("uvicorn")
+
+from starlette.websockets import WebSocketState
+
+from src.web import monitor
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+class FakeWebSocket:
+    """WebSocket stand-in recording sent frames and close calls."""
+
+    def __init__(self, stall: bool = False, error: Exception = None):
+        self.stall = stall
+        self.error = error
+        self.sent = []
+        self.close_codes = []
+        self.client_state = WebSocketState.CONNECTED
+        self.application_state = WebSocketState.CONNECTED
+
+    async def send_text(self, message: str) -> None:
+        if self.stall:
+            await asyncio.sleep(3600)
+        if self.error is not None:
+            raise self.error
+        self.sent.append(message)
+
+    async def close(self, code: int = 1000) -> None:
+        self.close_codes.append(code)
+        self.application_state = WebSocketState.DISCONNECTED
+
+
+@pytest.fixture
+def connections(monkeypatch):
+    """Empty client set and a short send timeout."""
+    monkeypatch.setattr(monitor, "ws_connections", set())
+    monkeypatch.setattr(monitor, "BROADCAST_SEND_TIMEOUT", 0.05)
+    return monitor.ws_connections
+
+
+# =============================================================================
+# Broadcast Tests
+# =============================================================================
+
+class TestBroadcast:
+    """Tests for broadcast_update."""
+
+    def test_delivers_to_connected_clients(self, connections):
+        """Every connected client receives the frame."""
+        clients = [FakeWebSocket() for _ in range(3)]
+        connections.update(clients)
+        asyncio.run(monitor.broadcast_update({"type": "ping"}))
+        assert all(ws.sent == ['{"type": "ping"}'] for ws in clients)
+        assert all(ws.close_codes == [] for ws in clients)
+
+    def test_stalled_client_is_dropped_and_closed(self, connections):
+        """A client whose send times out is removed and closed so it reconnects."""
+        stalled, healthy = FakeWebSocket(stall=True), FakeWebSocket()
+        connections.update([stalled, healthy])
+        asyncio.run(monitor.broadcast_update({"type": "ping"}))
+        assert stalled not in connections
+        assert stalled.close_codes == [1011]
+        assert healthy in connections
+        assert healthy.sent == ['{"type": "ping"}']
+
+    def test_disconnected_client_is_closed_without_send(self, connections):
+        """A client no longer CONNECTED is not sent to, but is closed."""
+        gone = FakeWebSocket()
+        gone.client_state = WebSocketState.DISCONNECTED
+        connections.add(gone)
+        asyncio.run(monitor.broadcast_update({"type": "ping"}))
+        assert gone not in connections
+        assert gone.sent == []
+        assert gone.close_codes == [1011]
+
+    def test_failed_send_is_dropped_and_closed(self, connections):
+        """Disconnect errors and unexpected errors both close the client."""
+        clients = [
+            FakeWebSocket(error=RuntimeError("closed")),
+            FakeWebSocket(error=ValueError("unexpected")),
+        ]
+        connections.update(clients)
+        asyncio.run(monitor.broadcast_update({"type": "ping"}))
+        assert not connections
+        assert all(ws.close_codes == [1011] for ws in clients)
+
+    def test_already_closed_client_is_not_closed_again(self, connections):
+        """No second close for a socket the server side already closed."""
+        closed = FakeWebSocket()
+        closed.client_state = WebSocketState.DISCONNECTED
+        closed.application_state = WebSocketState.DISCONNECTED
+        connections.add(closed)
+        asyncio.run(monitor.broadcast_update({"type": "ping"}))
+        assert closed not in connections
+        assert closed.close_codes == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
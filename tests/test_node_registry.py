@@ -205,6 +205,48 @@ def test_registration():
     except Exception as e:
         results.add("Deregister non-existent returns False", False, str(e))
 
+    # Test 1.8: A waiting writer is not starved by new readers
+    try:
+        import threading
+        import time
+        from registry.node_registry import ReadWriteLock
+
+        lock = ReadWriteLock()
+        order = []
+        release_reader = threading.Event()
+
+        def hold_read():
+            with lock.read_lock():
+                release_reader.wait(timeout=5)
+
+        def write():
+            with lock.write_lock():
+                order.append("writer")
+
+        def late_read():
+            with lock.read_lock():
+                order.append("reader")
+
+        holder = threading.Thread(target=hold_read)
+        holder.start()
+        while lock._readers == 0:
+            time.sleep(0.001)
+        writer = threading.Thread(target=write)
+        writer.start()
+        while lock._writers_waiting == 0:
+            time.sleep(0.001)
+        reader = threading.Thread(target=late_read)
+        reader.start()
+        time.sleep(0.05)
+        blocked = order == []
+        release_reader.set()
+        for t in (holder, writer, reader):
+            t.join(timeout=5)
+        results.add("Waiting writer goes before new readers",
+                   blocked and order == ["writer", "reader"])
+    except Exception as e:
+        results.add("Waiting writer goes before new readers", False, str(e))
+
 
 # =============================================================================
 # 2. Heartbeat Tests
@@ -231,9 +273,10 @@ def test_heartbeat():
     # Test 2.2: Update heartbeat
     try:
         time.sleep(0.1)
-        old_last_seen = registry._nodes[node_id].last_seen
+        old_last_seen = registry.get_node(node_id).status.lease.renew_time
+        time.sleep(0.1)
         registry.update_heartbeat(node_id)
-        new_last_seen = registry._nodes[node_id].last_seen
+        new_last_seen = registry.get_node(node_id).status.lease.renew_time
         results.add("Heartbeat updates last_seen", new_last_seen > old_last_seen)
     except Exception as e:
         results.add("Heartbeat updates last_seen", False, str(e))
@@ -389,6 +432,15 @@ def test_capability_discovery():
     except Exception as e:
         results.add("has_capability method", False, str(e))
 
+    # Test 4.5: get_capability lookup on spec
+    try:
+        passport = registry.get_node_by_name("text-agent")
+        cap = passport.spec.get_capability("generate_text")
+        missing = passport.spec.get_capability("generate_code")
+        results.add("get_capability lookup", cap is not None and cap.name == "generate_text" and missing is None)
+    except Exception as e:
+        results.add("get_capability lookup", False, str(e))
+
 
 # =============================================================================
 # 5. Node Type Filter Tests
@@ -470,6 +522,23 @@ def test_cleanup_thread():
     except Exception as e:
         results.add("Stop cleanup thread", False, str(e))
 
+    # Test 6.4: Registrations wake the thread without triggering a scan
+    try:
+        quiet = NodeRegistry()
+        quiet.config["ttl_seconds"] = 60
+        quiet.config["cleanup_interval_seconds"] = 0.01
+        scans = []
+        remove_dead_nodes = quiet.remove_dead_nodes
+        quiet.remove_dead_nodes = lambda: scans.append(1) or remove_dead_nodes()
+        quiet.start_cleanup_thread()
+        for i in range(5):
+            quiet.register_node(create_test_passport(f"quiet-agent-{i}"))
+            time.sleep(0.02)
+        quiet.stop_cleanup_thread()
+        results.add("Registration wakeups skip the scan", scans == [])
+    except Exception as e:
+        results.add("Registration wakeups skip the scan", False, str(e))
+
 
 # =============================================================================
 # 7. Event Callbacks Tests
@@ -507,6 +576,25 @@ def test_event_callbacks():
     except Exception as e:
         results.add("Deregistration callback fired", False, str(e))
 
+    # Test 7.3: Unhealthy callback may query the registry (no deadlock)
+    try:
+        registry.config["ttl_seconds"] = 0
+        seen_in_callback = []
+        registry.on_node_unhealthy(
+            lambda node_id: seen_in_callback.append(len(registry.get_all_nodes()))
+        )
+        registry.register_node(create_test_passport("reentrant-agent"))
+
+        worker = threading.Thread(target=registry.remove_dead_nodes, daemon=True)
+        worker.start()
+        worker.join(timeout=2.0)
+        results.add(
+            "Unhealthy callback can query registry",
+            not worker.is_alive() and seen_in_callback == [0],
+        )
+    except Exception as e:
+        results.add("Unhealthy callback can query registry", False, str(e))
+
 
 # =============================================================================
 # 8. Statistics Tests
@@ -39,8 +39,10 @@ from storage.models import (
     ArtifactVisibility,
     ModelParams,
     generate_artifact_id,
+    validate_artifact_id,
     compute_checksum,
     ARTIFACT_TYPES,
+    ARTIFACT_TYPE_NAMES,
 )
 from storage.file_storage import FileStorage
 from storage.storage_service import PersistentStorageService, StorageServiceHandler
@@ -108,6 +110,35 @@ class TestResults:
 results = TestResults()
 
 
+# artifacts table as created by the first release (inline UNIQUE checksum)
+BASELINE_ARTIFACTS_SCHEMA = """
+CREATE TABLE artifacts (
+    id VARCHAR(100) NOT NULL,
+    version INTEGER NOT NULL,
+    trace_id VARCHAR(100) NOT NULL,
+    step_id VARCHAR(100),
+    created_by VARCHAR(100) NOT NULL,
+    created_at DATETIME NOT NULL,
+    artifact_type VARCHAR(50) NOT NULL,
+    content_type VARCHAR(100) NOT NULL,
+    uri TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    checksum VARCHAR(100) NOT NULL,
+    status VARCHAR(9) NOT NULL,
+    retention VARCHAR(50) NOT NULL,
+    owner VARCHAR(100) NOT NULL,
+    visibility VARCHAR(7) NOT NULL,
+    context JSON,
+    supersedes VARCHAR(100),
+    PRIMARY KEY (id),
+    UNIQUE (checksum)
+);
+CREATE INDEX ix_artifacts_trace_id ON artifacts (trace_id);
+CREATE INDEX ix_artifacts_artifact_type ON artifacts (artifact_type);
+CREATE INDEX ix_artifacts_created_by ON artifacts (created_by);
+"""
+
+
 # =============================================================================
 # Test Fixtures
 # =============================================================================
@@ -222,6 +253,21 @@ def test_models():
     except Exception:
         results.add("ArtifactManifest rejects invalid ID", True)
 
+    # Test 1.7a: validate_artifact_id for API boundaries
+    try:
+        good = generate_artifact_id()
+        rejected = True
+        for bad in ("art_not-a-uuid", good + "\n"):
+            try:
+                validate_artifact_id(bad)
+                rejected = False
+            except ValueError:
+                pass
+        results.add("validate_artifact_id accepts valid, rejects invalid",
+                   validate_artifact_id(good) == good and rejected)
+    except Exception as e:
+        results.add("validate_artifact_id accepts valid, rejects invalid", False, str(e))
+
     # Test 1.8: ArtifactContext validation
     try:
         context = ArtifactContext(
@@ -241,6 +287,18 @@ def test_models():
     except Exception as e:
         results.add("ARTIFACT_TYPES has standard types", False, str(e))
 
+    # Test 1.9a: type tables are read-only
+    try:
+        try:
+            ARTIFACT_TYPES["custom"] = "x"
+            mutable = True
+        except TypeError:
+            mutable = False
+        results.add("ARTIFACT_TYPES is read-only",
+                   not mutable and ARTIFACT_TYPE_NAMES == set(ARTIFACT_TYPES))
+    except Exception as e:
+        results.add("ARTIFACT_TYPES is read-only", False, str(e))
+
 
 # =============================================================================
 # 2. FileStorage Tests
@@ -281,6 +339,20 @@ def test_file_storage():
         except Exception as e:
             results.add("Move to permanent succeeds", False, str(e))
 
+        # Test 2.3a: Cross-filesystem move copies the file and removes temp
+        try:
+            content = b"cross device content" * 100
+            temp_uri = fs.upload_to_temp(content, "cross_dev.txt")
+            fs._same_dev = False
+            try:
+                perm_uri = fs.move_to_permanent(temp_uri, "trace_001", "cross.txt")
+            finally:
+                fs._same_dev = True
+            results.add("Cross-filesystem move copies and removes temp",
+                       fs.read(perm_uri) == content and not fs.exists(temp_uri))
+        except Exception as e:
+            results.add("Cross-filesystem move copies and removes temp", False, str(e))
+
         # Test 2.4: Read file
         try:
             content = b"read test"
@@ -290,6 +362,34 @@ def test_file_storage():
         except Exception as e:
             results.add("Read file content matches", False, str(e))
 
+        # Test 2.4a: copy_to writes file content to a descriptor
+        try:
+            content = b"copy_to test " * 500
+            uri = fs.upload(content, "trace_002", "copy_to.txt")
+            dst_path = os.path.join(fixture.temp_dir, "copy_to_dst.bin")
+            dst_fd = os.open(dst_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                copied = fs.copy_to(uri, dst_fd)
+            finally:
+                os.close(dst_fd)
+            with open(dst_path, "rb") as f:
+                results.add("copy_to copies file content",
+                           copied == len(content) and f.read() == content)
+        except Exception as e:
+            results.add("copy_to copies file content", False, str(e))
+
+        # Test 2.4b: read_mmap exposes file content as a memoryview
+        try:
+            content = b"mmap read " * 500
+            uri = fs.upload(content, "trace_002", "mmap.txt")
+            empty_uri = fs.upload(b"", "trace_002", "mmap_empty.txt")
+            with fs.read_mmap(uri) as view, fs.read_mmap(empty_uri) as empty_view:
+                ok = (isinstance(view, memoryview) and view == content and
+                      len(empty_view) == 0)
+            results.add("read_mmap maps file content", ok)
+        except Exception as e:
+            results.add("read_mmap maps file content", False, str(e))
+
         # Test 2.5: File exists check
         try:
             content = b"exists test"
@@ -315,6 +415,19 @@ def test_file_storage():
         except Exception as e:
             results.add("Delete returns True and removes file", False, str(e))
 
+        # Test 2.7a: Missing local file: delete returns False, read raises
+        try:
+            missing = f"file://{fixture.base_path}/missing.txt"
+            try:
+                fs.read(missing)
+                read_raised = False
+            except FileNotFoundError:
+                read_raised = True
+            results.add("Missing file: delete False, read raises",
+                       fs.delete(missing) is False and read_raised)
+        except Exception as e:
+            results.add("Missing file: delete False, read raises", False, str(e))
+
         # Test 2.8: Get file size
         try:
             content = b"size test - 20 bytes"
@@ -342,6 +455,43 @@ def test_file_storage():
         except Exception as e:
             results.add("Verify checksum succeeds", False, str(e))
 
+        # Test 2.10a: File checksum matches bytes checksum (incl. empty file)
+        try:
+            content = b"file checksum test"
+            uri = fs.upload(content, "trace_006", "file_checksum.txt")
+            empty_uri = fs.upload(b"", "trace_006", "empty.txt")
+            results.add("File checksum matches bytes checksum",
+                       fs.compute_checksum_file(uri.replace("file://", "")) ==
+                       fs.compute_checksum(content) and
+                       fs.verify_checksum(empty_uri, fs.compute_checksum(b"")))
+        except Exception as e:
+            results.add("File checksum matches bytes checksum", False, str(e))
+
+        # Test 2.10c: Remote URIs are verified by streaming
+        try:
+            import fsspec
+            content = b"remote " * 300000
+            remote_uri = "memory://verify_remote/remote.bin"
+            fsspec.filesystem("memory").pipe(remote_uri, content)
+            results.add("Verify checksum streams remote files",
+                       fs.verify_checksum(remote_uri, fs.compute_checksum(content)) and
+                       not fs.verify_checksum(remote_uri, fs.compute_checksum(b"other")))
+        except Exception as e:
+            results.add("Verify checksum streams remote files", False, str(e))
+
+        # Test 2.10b: Streaming upload returns size and checksum in one pass
+        try:
+            import io
+            content = b"streamed " * 1000
+            uri, size, checksum = fs.upload_stream(
+                io.BytesIO(content), "trace_007", "stream.bin", bufsize=4096
+            )
+            results.add("Streaming upload returns size and checksum",
+                       fs.read(uri) == content and size == len(content) and
+                       checksum == fs.compute_checksum(content))
+        except Exception as e:
+            results.add("Streaming upload returns size and checksum", False, str(e))
+
         # Test 2.11: Buffer artifact
         try:
             artifact_id = generate_artifact_id()
@@ -361,6 +511,43 @@ def test_file_storage():
         except Exception as e:
             results.add("List buffered artifacts returns list", False, str(e))
 
+        # Test 2.12a: Re-buffering after removal recreates the directory
+        try:
+            artifact_id = generate_artifact_id()
+            fs.buffer_artifact(artifact_id, b"first", "{}")
+            fs.remove_buffered_artifact(artifact_id)
+            fs.buffer_artifact(artifact_id, b"second", "{}")
+            content, _ = fs.get_buffered_artifact(artifact_id)
+            results.add("Re-buffer after removal works", content == b"second")
+        except Exception as e:
+            results.add("Re-buffer after removal works", False, str(e))
+
+        # Test 2.12b: Buffering from temp moves the file instead of rewriting
+        try:
+            artifact_id = generate_artifact_id()
+            temp_uri = fs.upload_to_temp(b"already in temp", f"{artifact_id}_x.bin")
+            fs.buffer_existing_artifact(temp_uri, artifact_id, "{}")
+            content, manifest_json = fs.get_buffered_artifact(artifact_id)
+            results.add("Buffer existing temp file moves it",
+                       content == b"already in temp" and manifest_json == "{}" and
+                       not fs.exists(temp_uri))
+        except Exception as e:
+            results.add("Buffer existing temp file moves it", False, str(e))
+
+        # Test 2.12c: Placing buffered content renames it, and is idempotent
+        try:
+            artifact_id = generate_artifact_id()
+            fs.buffer_artifact(artifact_id, b"placed content", '{"id": "x"}')
+            placed_uri = fs.place_buffered_artifact(artifact_id, "trace_place", "placed.bin")
+            again_uri = fs.place_buffered_artifact(artifact_id, "trace_place", "placed.bin")
+            results.add("Place buffered artifact moves content",
+                       fs.read(placed_uri) == b"placed content" and
+                       again_uri == placed_uri and
+                       fs.get_buffered_manifest(artifact_id) == '{"id": "x"}' and
+                       not os.path.exists(fs.buffer_path / artifact_id / "content.bin"))
+        except Exception as e:
+            results.add("Place buffered artifact moves content", False, str(e))
+
         # Test 2.13: Get stats
         try:
             stats = fs.get_stats()
@@ -369,6 +556,22 @@ def test_file_storage():
         except Exception as e:
             results.add("Get stats returns dict with keys", False, str(e))
 
+        # Test 2.14: Stats and temp listing walk nested directories
+        try:
+            stats_before = fs.get_stats()["temp"]
+            old_uri = fs.upload_to_temp(b"12345", "nested/dir/old.txt")
+            fs.upload_to_temp(b"fresh", "nested/fresh.txt")
+            old_path = old_uri.replace("file://", "")
+            os.utime(old_path, (0, 0))
+            stats_after = fs.get_stats()["temp"]
+            results.add("Stats/temp listing walk nested dirs",
+                       stats_after["count"] == stats_before["count"] + 2 and
+                       stats_after["size_bytes"] == stats_before["size_bytes"] + 10 and
+                       old_uri in fs.list_temp_files(older_than_hours=1) and
+                       not any(u.endswith("fresh.txt") for u in fs.list_temp_files(1)))
+        except Exception as e:
+            results.add("Stats/temp listing walk nested dirs", False, str(e))
+
     finally:
         fixture.cleanup()
 
@@ -453,6 +656,7 @@ def test_artifact_registration():
                 trace_id="trace_reg_005",
                 created_by="test.agent",
                 filename="draft.json",
+                context={"model_name": "test-model", "input_artifacts": []},
             )
             fetched = storage.get_artifact(registered.id)
             results.add("Get artifact returns manifest",
@@ -460,6 +664,40 @@ def test_artifact_registration():
         except Exception as e:
             results.add("Get artifact returns manifest", False, str(e))
 
+        # Test 3.5a: Repeated lookups are cached and return independent copies
+        try:
+            first = storage.get_artifact(registered.id)
+            first.uri = "file:///changed"
+            first.context.input_artifacts.append("art_changed")
+            second = storage.get_artifact(registered.id)
+            results.add("Get artifact caches completed manifests",
+                       registered.id in storage._manifest_cache and
+                       second.uri == registered.uri and
+                       second.context.input_artifacts == [])
+        except Exception as e:
+            results.add("Get artifact caches completed manifests", False, str(e))
+
+        # Test 3.5b: A lookup racing with an invalidation does not cache its row
+        try:
+            storage._invalidate_manifest(registered.id)
+            to_manifest = ArtifactModel.to_manifest
+
+            def invalidating_to_manifest(self):
+                # Delete lands between the reader's SELECT and its cache insert
+                storage._invalidate_manifest(self.id)
+                return to_manifest(self)
+
+            ArtifactModel.to_manifest = invalidating_to_manifest
+            try:
+                raced = storage.get_artifact(registered.id)
+            finally:
+                ArtifactModel.to_manifest = to_manifest
+            results.add("Get artifact skips caching after a racing invalidation",
+                       raced is not None and
+                       registered.id not in storage._manifest_cache)
+        except Exception as e:
+            results.add("Get artifact skips caching after a racing invalidation", False, str(e))
+
         # Test 3.6: Get artifact content
         try:
             content = b'{"content_test": 123}'
@@ -511,6 +749,57 @@ def test_artifact_registration():
         except Exception as e:
             results.add("Register with context stores context", False, str(e))
 
+        # Test 3.9: Failed metadata insert buffers the placed file
+        try:
+            content = b'{"insert_fails": true}'
+            before = set(storage.file_storage.list_buffered_artifacts())
+            bulk_insert = ArtifactModel.bulk_insert_manifests
+
+            def failing_insert(session, manifests, page_size=None):
+                raise RuntimeError("database unavailable")
+
+            ArtifactModel.bulk_insert_manifests = failing_insert
+            try:
+                storage.register_artifact(
+                    content=content, artifact_type="log", trace_id="trace_reg_008",
+                    created_by="test.agent", filename="fails.json",
+                )
+                raised = False
+            except RuntimeError:
+                raised = True
+            finally:
+                ArtifactModel.bulk_insert_manifests = bulk_insert
+            new_ids = set(storage.file_storage.list_buffered_artifacts()) - before
+            buffered_content = (
+                storage.file_storage.get_buffered_artifact(new_ids.pop())[0]
+                if len(new_ids) == 1 else None
+            )
+            placed = list(Path(fixture.base_path, "trace_reg_008").glob("*"))
+            results.add("Failed registration buffers content",
+                       raised and buffered_content == content and not placed)
+        except Exception as e:
+            results.add("Failed registration buffers content", False, str(e))
+
+        # Test 3.10: Identical content is hard-linked, not stored twice
+        try:
+            content = b'{"same": "content"}'
+            first = storage.register_artifact(
+                content=content, artifact_type="log", trace_id="trace_reg_009",
+                created_by="test.agent", filename="first.json",
+            )
+            second = storage.register_artifact(
+                content=content, artifact_type="log", trace_id="trace_reg_010",
+                created_by="test.agent", filename="second.json",
+            )
+            first_stat = os.stat(first.uri.replace("file://", ""))
+            second_stat = os.stat(second.uri.replace("file://", ""))
+            results.add("Duplicate content is deduplicated",
+                       second.id != first.id and second.checksum == first.checksum and
+                       first_stat.st_ino == second_stat.st_ino and
+                       storage.get_artifact_content(second.id) == content)
+        except Exception as e:
+            results.add("Duplicate content is deduplicated", False, str(e))
+
     finally:
         fixture.cleanup()
 
@@ -588,12 +877,30 @@ def test_cleanup_operations():
                 created_by="test.agent",
                 filename="delete.json",
             )
+            storage.get_artifact(manifest.id)  # warm the manifest cache
             deleted = storage.delete_artifact(manifest.id)
             after = storage.get_artifact(manifest.id)
             results.add("Delete artifact removes from DB", deleted and after is None)
         except Exception as e:
             results.add("Delete artifact removes from DB", False, str(e))
 
+        # Test 5.1a: Delete leaves committing to the caller's session
+        try:
+            manifest = storage.register_artifact(
+                content=b'{"delete_scope_test": true}',
+                artifact_type="log",
+                trace_id="trace_delete_scope",
+                created_by="test.agent",
+                filename="delete_scope.json",
+            )
+            with storage.SessionLocal() as session:
+                deleted = storage.delete_artifact(manifest.id, session=session)
+                session.rollback()
+            results.add("Delete with caller session does not commit",
+                       deleted and storage.get_artifact(manifest.id) is not None)
+        except Exception as e:
+            results.add("Delete with caller session does not commit", False, str(e))
+
         # Test 5.2: Delete moves file to orphans
         try:
             content = b'{"orphan_test": true}'
@@ -618,6 +925,37 @@ def test_cleanup_operations():
         except Exception as e:
             results.add("Delete non-existent returns False", False, str(e))
 
+        # Test 5.4: Recovery orphans permanent files that have no row
+        try:
+            kept = storage.register_artifact(
+                content=b'{"kept": true}',
+                artifact_type="log",
+                trace_id="trace_reconcile",
+                created_by="test.agent",
+                filename="kept.json",
+            )
+            # File placed, then a crash before its INSERT
+            stray_uri = storage.file_storage.upload(
+                b'{"stray": true}', "trace_reconcile", "art_stray_artifact"
+            )
+            from sqlalchemy import update
+            # Rows keep the absolute URI of a data directory that has moved
+            with storage.SessionLocal() as session, session.begin():
+                session.execute(
+                    update(ArtifactModel)
+                    .where(ArtifactModel.id == kept.id)
+                    .values(uri="file:///moved/trace_reconcile/kept.json")
+                )
+            orphans_before = len(list(Path(fixture.orphans_path).glob("*")))
+            fixture.create_storage_service()
+            orphans_after = len(list(Path(fixture.orphans_path).glob("*")))
+            results.add("Recovery orphans files without metadata",
+                       not storage.file_storage.exists(stray_uri) and
+                       storage.file_storage.exists(kept.uri) and
+                       orphans_after == orphans_before + 1)
+        except Exception as e:
+            results.add("Recovery orphans files without metadata", False, str(e))
+
     finally:
         fixture.cleanup()
 
@@ -675,6 +1013,35 @@ def test_statistics():
         except Exception as e:
             results.add("Stats has storage type", False, str(e))
 
+        # Test 6.5: Missing status buckets count as zero
+        try:
+            counts = storage.get_stats()["artifacts"]
+            results.add("Stats fill missing statuses with zero",
+                       counts["failed"] == 0 and counts["uploading"] == 0 and
+                       counts["total"] == counts["completed"] == 5)
+        except Exception as e:
+            results.add("Stats fill missing statuses with zero", False, str(e))
+
+        # Test 6.6: Buffer count comes from the buffer index
+        try:
+            manifest = ArtifactManifest(
+                id=generate_artifact_id(),
+                trace_id="trace_stats_buffer",
+                created_by="test.agent",
+                artifact_type="log",
+                uri="file:///pending",
+                size_bytes=7,
+                checksum=compute_checksum(b"pending"),
+                owner="test.agent",
+            )
+            storage._buffer_artifact(manifest, b"pending")
+            count = storage.get_stats()["buffer"]["count"]
+            storage.file_storage.remove_buffered_artifact(manifest.id)
+            results.add("Stats buffer count tracks buffered artifacts",
+                       count == len(storage._buffer_index) == 1)
+        except Exception as e:
+            results.add("Stats buffer count tracks buffered artifacts", False, str(e))
+
     finally:
         fixture.cleanup()
 
@@ -728,6 +1095,87 @@ def test_handler():
         except Exception as e:
             results.add("Handler get_artifact works", False, str(e))
 
+        # Test 7.2a: Get artifact content via handler (incl. empty file)
+        try:
+            raw = b'{"content_test": true}' * 100
+            reg_result = handler.handle_command("register_artifact", {
+                "content": base64.b64encode(raw).decode(),
+                "artifact_type": "log",
+                "trace_id": "trace_handler_002",
+                "created_by": "test.agent",
+                "filename": "content.json",
+            })
+            empty_result = handler.handle_command("register_artifact", {
+                "content": "",
+                "artifact_type": "log",
+                "trace_id": "trace_handler_002",
+                "created_by": "test.agent",
+                "filename": "empty.json",
+            })
+            got = handler.handle_command("get_artifact_content", {
+                "artifact_id": reg_result["artifact_id"],
+            })
+            got_empty = handler.handle_command("get_artifact_content", {
+                "artifact_id": empty_result["artifact_id"],
+            })
+            results.add("Handler get_artifact_content works",
+                       base64.b64decode(got["content"]) == raw and
+                       got["size_bytes"] == len(raw) and
+                       got_empty["content"] == "" and got_empty["size_bytes"] == 0)
+        except Exception as e:
+            results.add("Handler get_artifact_content works", False, str(e))
+
+        # Test 7.2b: Content larger than one base64 chunk round-trips
+        try:
+            raw = os.urandom((3 << 20) + 2)
+            reg_result = handler.handle_command("register_artifact", {
+                "content": raw,
+                "artifact_type": "log",
+                "trace_id": "trace_handler_002",
+                "created_by": "test.agent",
+                "filename": "large.bin",
+                "content_type": "application/octet-stream",
+            })
+            got = handler.handle_command("get_artifact_content", {
+                "artifact_id": reg_result["artifact_id"],
+            })
+            results.add("Handler encodes multi-chunk content",
+                       got["content"] == base64.b64encode(raw).decode())
+        except Exception as e:
+            results.add("Handler encodes multi-chunk content", False, str(e))
+
+        # Test 7.2c: One session per command
+        try:
+            reg_result = handler.handle_command("register_artifact", {
+                "content": b"one session",
+                "artifact_type": "log",
+                "trace_id": "trace_handler_002",
+                "created_by": "test.agent",
+                "filename": "session.txt",
+            })
+            session_factory = storage.SessionLocal
+            opened = []
+
+            def counting_factory():
+                opened.append(1)
+                return session_factory()
+
+            storage.SessionLocal = counting_factory
+            try:
+                handler.handle_command("verify_artifact", {
+                    "artifact_id": reg_result["artifact_id"],
+                })
+                handler.handle_command("delete_artifact", {
+                    "artifact_id": reg_result["artifact_id"],
+                })
+            finally:
+                storage.SessionLocal = session_factory
+            results.add("Handler opens one session per command",
+                       len(opened) == 2 and
+                       storage.get_artifact(reg_result["artifact_id"]) is None)
+        except Exception as e:
+            results.add("Handler opens one session per command", False, str(e))
+
         # Test 7.3: List artifacts via handler
         try:
             result = handler.handle_command("list_artifacts", {
@@ -782,6 +1230,100 @@ def test_sqlalchemy_models():
     try:
         storage = fixture.create_storage_service()
 
+        # Test 8.0: Connections are tuned (WAL, synchronous=NORMAL)
+        try:
+            from sqlalchemy import text
+            with storage.engine.connect() as conn:
+                journal_mode = conn.execute(text("PRAGMA journal_mode")).scalar()
+                synchronous = conn.execute(text("PRAGMA synchronous")).scalar()
+            results.add("SQLite uses WAL with synchronous=NORMAL",
+                       journal_mode == "wal" and synchronous == 1)
+        except Exception as e:
+            results.add("SQLite uses WAL with synchronous=NORMAL", False, str(e))
+
+        # Test 8.0a: Listing and recovery queries are served by indexes
+        try:
+            with storage.engine.connect() as conn:
+                plans = {
+                    sql: " ".join(row[-1] for row in conn.exec_driver_sql(
+                        f"EXPLAIN QUERY PLAN {sql}", params).all())
+                    for sql, params in (
+                        ("SELECT id FROM artifacts WHERE created_by = ? "
+                         "ORDER BY created_at DESC LIMIT 10", ("test.agent",)),
+                        ("SELECT id, uri FROM artifacts WHERE status = ?", ("UPLOADING",)),
+                    )
+                }
+            results.add("List and recovery queries use indexes",
+                       all("USING INDEX" in plan and "TEMP B-TREE" not in plan
+                           for plan in plans.values()))
+        except Exception as e:
+            results.add("List and recovery queries use indexes", False, str(e))
+
+        # Test 8.0b: Database from the original schema is upgraded in place
+        upgrade = TempStorageFixture()
+        try:
+            import sqlite3
+            conn = sqlite3.connect(upgrade.db_path)
+            conn.executescript(BASELINE_ARTIFACTS_SCHEMA)
+            conn.execute(
+                "INSERT INTO artifacts VALUES ('art_old', 1, 'trace_old', NULL, "
+                "'test.agent', '2025-01-01 00:00:00', 'log', 'application/json', "
+                "'file:///missing', 2, 'sha256:old', 'COMPLETED', 'infinite', "
+                "'test.agent', 'TRACE', NULL, NULL)"
+            )
+            conn.commit()
+            conn.close()
+
+            upgraded = upgrade.create_storage_service()
+            content = b'{"upgrade": true}'
+            first = upgraded.register_artifact(
+                content=content, artifact_type="log", trace_id="trace_up_001",
+                created_by="test.agent", filename="a.json",
+            )
+            second = upgraded.register_artifact(
+                content=content, artifact_type="log", trace_id="trace_up_002",
+                created_by="test.agent", filename="b.json",
+            )
+            with upgraded.engine.connect() as conn:
+                table_sql = conn.exec_driver_sql(
+                    "SELECT sql FROM sqlite_master WHERE name = 'artifacts'"
+                ).scalar()
+                index_names = {row[0] for row in conn.exec_driver_sql(
+                    "SELECT name FROM sqlite_master WHERE type = 'index' "
+                    "AND tbl_name = 'artifacts'"
+                )}
+            results.add("Original schema upgraded, duplicates deduplicated",
+                       "UNIQUE" not in table_sql and
+                       "ix_art_checksum" in index_names and
+                       upgraded.get_artifact("art_old") is not None and
+                       second.status == "completed" and
+                       upgraded.file_storage.list_buffered_artifacts() == [] and
+                       os.stat(first.uri.replace("file://", "")).st_ino ==
+                       os.stat(second.uri.replace("file://", "")).st_ino)
+            upgraded.engine.dispose()
+        except Exception as e:
+            results.add("Original schema upgraded, duplicates deduplicated", False, str(e))
+        finally:
+            upgrade.cleanup()
+
+        # Test 8.0c: Undeclared single-column indexes are dropped on open
+        try:
+            with storage.engine.begin() as conn:
+                conn.exec_driver_sql(
+                    "CREATE INDEX ix_artifacts_trace_id ON artifacts (trace_id)")
+            reopened = fixture.create_storage_service()
+            with reopened.engine.connect() as conn:
+                index_names = {row[0] for row in conn.exec_driver_sql(
+                    "SELECT name FROM sqlite_master WHERE type = 'index' "
+                    "AND tbl_name = 'artifacts'"
+                )}
+            reopened.engine.dispose()
+            results.add("Stale indexes dropped on open",
+                       "ix_artifacts_trace_id" not in index_names and
+                       "ix_art_trace_created" in index_names)
+        except Exception as e:
+            results.add("Stale indexes dropped on open", False, str(e))
+
         # Test 8.1: Model to manifest conversion
         try:
             content = b'{"conversion_test": true}'
@@ -800,6 +1342,160 @@ def test_sqlalchemy_models():
         except Exception as e:
             results.add("Model to manifest conversion works", False, str(e))
 
+        # Test 8.1b: Buffered artifacts are recovered with one batch insert
+        try:
+            buffered_ids = []
+            for i in range(3):
+                manifest = ArtifactManifest(
+                    id=generate_artifact_id(),
+                    trace_id="trace_sql_buffer",
+                    created_by="test.agent",
+                    artifact_type="log",
+                    uri="file:///pending",
+                    size_bytes=1,
+                    checksum=compute_checksum(f"buffered {i}".encode()),
+                    owner="test.agent",
+                )
+                storage.file_storage.buffer_artifact(
+                    manifest.id, f"buffered {i}".encode(), manifest.model_dump_json()
+                )
+                buffered_ids.append(manifest.id)
+            recovered = fixture.create_storage_service()
+            fetched = [recovered.get_artifact(a) for a in buffered_ids]
+            results.add("Buffered artifacts recovered in batch",
+                       all(m is not None and m.status == "completed" for m in fetched) and
+                       recovered.get_artifact_content(buffered_ids[1]) == b"buffered 1" and
+                       not recovered.file_storage.list_buffered_artifacts())
+        except Exception as e:
+            results.add("Buffered artifacts recovered in batch", False, str(e))
+
+        # Test 8.1c: Bulk insert splits rows into pages
+        try:
+            manifests = [
+                ArtifactManifest(
+                    id=generate_artifact_id(),
+                    trace_id="trace_sql_pages",
+                    created_by="test.agent",
+                    artifact_type="log",
+                    uri=f"file:///page_{i}",
+                    size_bytes=1,
+                    checksum=compute_checksum(f"page {i}".encode()),
+                    owner="test.agent",
+                    status="completed",
+                )
+                for i in range(5)
+            ]
+            with storage.SessionLocal() as session, session.begin():
+                ArtifactModel.bulk_insert_manifests(session, manifests, page_size=2)
+            listed = storage.list_artifacts(trace_id="trace_sql_pages")
+            results.add("Bulk insert pages rows", len(listed) == 5)
+        except Exception as e:
+            results.add("Bulk insert pages rows", False, str(e))
+
+        # Test 8.1d: Recovery resolves uploading rows by file presence
+        try:
+            present = storage.register_artifact(
+                content=b"present", artifact_type="log", trace_id="trace_sql_recover",
+                created_by="test.agent", filename="present.txt",
+            )
+            stuck = [
+                ArtifactManifest(
+                    id=generate_artifact_id(),
+                    trace_id="trace_sql_recover",
+                    created_by="test.agent",
+                    artifact_type="log",
+                    uri=uri,
+                    size_bytes=1,
+                    checksum=compute_checksum(f"stuck {i}".encode()),
+                    owner="test.agent",
+                    status="uploading",
+                )
+                for i, uri in enumerate((present.uri, "file:///missing/stuck.bin"))
+            ]
+            with storage.SessionLocal() as session, session.begin():
+                ArtifactModel.bulk_insert_manifests(session, stuck)
+            recovered = fixture.create_storage_service()
+            results.add("Recovery completes or fails uploading rows",
+                       recovered.get_artifact(stuck[0].id).status == "completed" and
+                       recovered.get_artifact(stuck[1].id).status == "failed")
+        except Exception as e:
+            results.add("Recovery completes or fails uploading rows", False, str(e))
+
+        # Test 8.1e: Full buffer evicts the oldest entry first
+        try:
+            small = fixture.create_storage_service()
+            small.buffer_max_items = 2
+            evict_ids = []
+            for i in range(3):
+                manifest = ArtifactManifest(
+                    id=generate_artifact_id(),
+                    trace_id="trace_sql_evict",
+                    created_by="test.agent",
+                    artifact_type="log",
+                    uri="file:///pending",
+                    size_bytes=1,
+                    checksum=compute_checksum(f"evict {i}".encode()),
+                    owner="test.agent",
+                )
+                small._buffer_artifact(manifest, f"evict {i}".encode())
+                evict_ids.append(manifest.id)
+            remaining = set(small.file_storage.list_buffered_artifacts())
+            results.add("Buffer evicts oldest when full",
+                       remaining == set(evict_ids[1:]) and
+                       list(small._buffer_index) == evict_ids[1:])
+            for artifact_id in evict_ids:
+                small.file_storage.remove_buffered_artifact(artifact_id)
+        except Exception as e:
+            results.add("Buffer evicts oldest when full", False, str(e))
+
+        # Test 8.1f: Failed buffer write leaves no index entry
+        try:
+            failing = fixture.create_storage_service()
+            manifest = ArtifactManifest(
+                id=generate_artifact_id(),
+                trace_id="trace_sql_buffer_fail",
+                created_by="test.agent",
+                artifact_type="log",
+                uri="file:///pending",
+                size_bytes=1,
+                checksum=compute_checksum(b"lost"),
+                owner="test.agent",
+            )
+
+            def broken_buffer(*args, **kwargs):
+                raise OSError("disk full")
+
+            failing.file_storage.buffer_artifact = broken_buffer
+            try:
+                failing._buffer_artifact(manifest, b"lost")
+                raised = False
+            except OSError:
+                raised = True
+            results.add("Failed buffer write is not indexed",
+                       raised and manifest.id not in failing._buffer_index)
+        except Exception as e:
+            results.add("Failed buffer write is not indexed", False, str(e))
+
+        # Test 8.1a: Manifest from DB round-trips to JSON like the original
+        try:
+            content = b'{"roundtrip_test": true}'
+            manifest = storage.register_artifact(
+                content=content,
+                artifact_type="log",
+                trace_id="trace_sql_001",
+                created_by="test.agent",
+                filename="roundtrip.json",
+            )
+            fetched = storage.get_artifact(manifest.id)
+            expected = manifest.model_dump(mode="json")
+            actual = fetched.model_dump(mode="json")
+            results.add("DB manifest dumps like registered manifest",
+                       set(actual) == set(expected) and
+                       actual["checksum"] == expected["checksum"] and
+                       actual["status"] == "completed")
+        except Exception as e:
+            results.add("DB manifest dumps like registered manifest", False, str(e))
+
         # Test 8.2: Status enum handling
         try:
             content = b'{"status_test": true}'
@@ -52,6 +52,13 @@ def service(mock_mindbus):
     return RegistryService()
 
 
+def deliver_heartbeat(service, event, data):
+    """Queue a heartbeat event and apply it as the drain thread would."""
+    service._enqueue_heartbeat(event, data)
+    service._heartbeat_queue.put(None)
+    service._drain_heartbeats()
+
+
 @pytest.fixture
 def sample_passport():
     """Create a sample NodePassport for testing."""
@@ -156,7 +163,7 @@ class TestNodeRegisteredHandler:
 
 
 class TestNodeHeartbeatHandler:
-    """Tests for _on_node_heartbeat handler."""
+    """Tests for node.heartbeat handling (_enqueue_heartbeat + drain)."""
 
     def test_updates_heartbeat(self, service, sample_passport):
         """Test that node.heartbeat event updates last_seen."""
@@ -173,7 +180,7 @@ class TestNodeHeartbeatHandler:
         # Small delay to ensure time difference
         time.sleep(0.01)
 
-        service._on_node_heartbeat(event, data)
+        deliver_heartbeat(service, event, data)
 
         assert service._heartbeats == 1
         assert service._events_processed == 1
@@ -183,7 +190,7 @@ class TestNodeHeartbeatHandler:
         event = {"id": "evt-1", "type": "node.heartbeat"}
         data = {"name": "some-name"}  # No node_id
 
-        service._on_node_heartbeat(event, data)
+        deliver_heartbeat(service, event, data)
 
         assert service._heartbeats == 0
         assert service._events_processed == 1
@@ -196,12 +203,39 @@ class TestNodeHeartbeatHandler:
             "name": "unknown.agent",
         }
 
-        service._on_node_heartbeat(event, data)
+        deliver_heartbeat(service, event, data)
 
         assert service._heartbeats == 0
         assert service._events_processed == 1
 
 
+class TestHeartbeatBatching:
+    """Tests for queued heartbeat processing."""
+
+    def test_batched_heartbeats_coalesce_per_node(self, service, sample_passport):
+        """Test that queued heartbeats are applied once per node per batch."""
+        service.registry.register_node(sample_passport)
+
+        event = {"id": "evt-1", "type": "node.heartbeat"}
+        data = {"node_id": sample_passport.metadata.uid}
+        for _ in range(5):
+            service._enqueue_heartbeat(event, data)
+        service._enqueue_heartbeat(event, {"node_id": "unknown-node-id"})
+        service._heartbeat_queue.put(None)
+
+        service._drain_heartbeats()
+
+        assert service._events_processed == 6
+        assert service._heartbeats == 1
+
+    def test_enqueue_handles_missing_node_id(self, service):
+        """Test that heartbeats without node_id are not queued."""
+        service._enqueue_heartbeat({"id": "evt-1"}, {"name": "some-name"})
+
+        assert service._heartbeat_queue.empty()
+        assert service._events_processed == 1
+
+
 class TestNodeDeregisteredHandler:
     """Tests for _on_node_deregistered handler."""
 
@@ -288,7 +322,7 @@ class TestServiceAPI:
         # Heartbeat
         hb_event = {"id": "evt-2", "type": "node.heartbeat"}
         hb_data = {"node_id": sample_passport.metadata.uid}
-        service._on_node_heartbeat(hb_event, hb_data)
+        deliver_heartbeat(service, hb_event, hb_data)
 
         stats = service.get_stats()
 
@@ -325,7 +359,7 @@ class TestLifecycle:
             "node_id": sample_passport.metadata.uid,
             "name": sample_passport.metadata.name,
         }
-        service._on_node_heartbeat(hb_event, hb_data)
+        deliver_heartbeat(service, hb_event, hb_data)
 
         assert service._heartbeats == 1
 
@@ -382,7 +416,7 @@ class TestLifecycle:
         for i in range(2):
             event = {"id": f"evt-hb-{i}"}
             data = {"node_id": f"node-{i}"}
-            service._on_node_heartbeat(event, data)
+            deliver_heartbeat(service, event, data)
 
         assert service._heartbeats == 2
 
@@ -395,6 +429,42 @@ class TestLifecycle:
         assert service._deregistrations == 1
 
 
+# =============================================================================
+# Test: Config loading
+# =============================================================================
+
+class TestConfigLoading:
+    """Tests for shared YAML config loading."""
+
+    def test_config_parsed_once(self, tmp_path):
+        """Test that the same unchanged file is parsed only once."""
+        from src.yaml_config import load_yaml_file
+
+        config_file = tmp_path / "registry.yaml"
+        config_file.write_text("registry:\n  ttl_seconds: 7\n")
+
+        first = load_yaml_file(str(config_file))
+        second = load_yaml_file(str(config_file))
+
+        assert first is second
+        assert first["registry"]["ttl_seconds"] == 7
+
+    def test_config_reloaded_after_change(self, tmp_path):
+        """Test that editing the file invalidates the cached parse."""
+        import os
+        from src.yaml_config import load_yaml_file
+
+        config_file = tmp_path / "registry.yaml"
+        config_file.write_text("registry:\n  ttl_seconds: 7\n")
+        load_yaml_file(str(config_file))
+
+        config_file.write_text("registry:\n  ttl_seconds: 9\n")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert load_yaml_file(str(config_file))["registry"]["ttl_seconds"] == 9
+
+
 # =============================================================================
 # Test: Import
 # =============================================================================
@@ -146,6 +146,109 @@ def test_node_type():
     except Exception as e:
         results.add("Passport has capabilities", False, str(e))
 
+    # Test 1.7: Config is not shared between instances
+    try:
+        other = create_test_service()
+        other.config["name"] = "mutated"
+        other.config["storage"]["max_files"] = 1
+        fresh = create_test_service()
+        results.add("Config isolated between instances",
+                   fresh.config["name"] == "storage-inmemory-01" and
+                   fresh.config["storage"]["max_files"] != 1)
+    except Exception as e:
+        results.add("Config isolated between instances", False, str(e))
+
+    # Test 1.8: Registration serializes static passport parts once, heartbeat is a plain dict
+    try:
+        from unittest.mock import MagicMock
+        svc = create_test_service()
+        svc.bus = MagicMock()
+        svc._send_registration_event()
+        svc._requests_processed = 5
+        svc._send_registration_event()
+        first, second = svc.bus.send_event.call_args_list
+        svc._send_heartbeat_event()
+        beat = svc.bus.send_event.call_args.kwargs["event_data"]
+        results.add("Passport serialized once, heartbeat from template",
+                   first.kwargs["event_data"]["passport"]["spec"] is
+                   second.kwargs["event_data"]["passport"]["spec"] and
+                   second.kwargs["event_data"]["passport"]["status"]["total_tasks_processed"] == 5 and
+                   beat["node_id"] == svc._node_uid and
+                   beat["total_tasks_processed"] == 5 and
+                   beat["renew_time"] is not None and
+                   svc.get_passport().status.total_tasks_processed == 5 and
+                   svc.get_passport().status.lease.renew_time.isoformat() == beat["renew_time"])
+    except Exception as e:
+        results.add("Passport serialized once, heartbeat from template", False, str(e))
+
+    # Test 1.9: Services share one heartbeat thread
+    try:
+        import threading
+        import time
+        from unittest.mock import MagicMock
+        services = [create_test_service() for _ in range(3)]
+        for svc in services:
+            svc.bus = MagicMock()
+            svc._heartbeat_interval = 0.05
+            svc._send_registration_event()
+            svc._start_heartbeat_thread()
+        time.sleep(0.2)
+        for svc in services:
+            svc._stop_heartbeat_thread()
+        beats = [
+            sum(1 for c in svc.bus.send_event.call_args_list
+                if c.kwargs["event_type_name"] == "node.heartbeat")
+            for svc in services
+        ]
+        threads = [t for t in threading.enumerate() if t.name == "heartbeat-scheduler"]
+        results.add("Heartbeats share one thread",
+                   all(n >= 2 for n in beats) and len(threads) == 1)
+    except Exception as e:
+        results.add("Heartbeats share one thread", False, str(e))
+
+    # Test 1.10: Config sidecar is only used for identical YAML content
+    try:
+        import os
+        import shutil
+        import tempfile
+        from src.yaml_config import CONFIG_CACHE_SUFFIX, _parse_yaml
+        tmp = tempfile.mkdtemp(prefix="ai_team_test_")
+        try:
+            path = os.path.join(tmp, "svc.yaml")
+            with open(path, "w") as f:
+                f.write("svc:\n  name: old\n")
+            st = os.stat(path)
+            first = _parse_yaml(path, st.st_mtime_ns, st.st_size, True)
+            # Restored file: same size, older mtime, different content
+            with open(path, "w") as f:
+                f.write("svc:\n  name: new\n")
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - 10 ** 9))
+            st = os.stat(path)
+            second = _parse_yaml(path, st.st_mtime_ns, st.st_size, True)
+            results.add("Config sidecar validated by content hash",
+                       first["svc"]["name"] == "old" and
+                       second["svc"]["name"] == "new" and
+                       os.path.exists(path + CONFIG_CACHE_SUFFIX))
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+    except Exception as e:
+        results.add("Config sidecar validated by content hash", False, str(e))
+
+    # Test 1.11: Stopping the service shuts down the hash executor
+    try:
+        from unittest.mock import MagicMock
+        svc = create_test_service()
+        svc.bus = MagicMock()
+        svc.stop()
+        try:
+            svc._hash_executor.submit(int)
+            shut_down = False
+        except RuntimeError:
+            shut_down = True
+        results.add("Stop shuts down hash executor", shut_down)
+    except Exception as e:
+        results.add("Stop shuts down hash executor", False, str(e))
+
 
 # =============================================================================
 # 2. File Operations Tests
@@ -221,6 +324,51 @@ def test_file_operations():
     except Exception as e:
         results.add("Delete file", False, str(e))
 
+    # Test 2.8: Prefix listing is sorted and excludes neighbours
+    try:
+        for path in ["/docs/b.txt", "/docs/a.txt", "/docsx/c.txt", "/doc.txt"]:
+            service.handle_command("save_file", {"path": path, "content": "x"})
+        service.handle_command("delete_file", {"path": "/docs/b.txt"})
+        service.handle_command("save_file", {"path": "/docs/c.txt", "content": "x"})
+        result = service.handle_command("list_files", {"prefix": "/docs/"})
+        listed = [f["path"] for f in result["files"]]
+        results.add("Prefix listing sorted", listed == ["/docs/a.txt", "/docs/c.txt"])
+    except Exception as e:
+        results.add("Prefix listing sorted", False, str(e))
+
+    # Test 2.9: Content stored as bytes, decoded on read
+    try:
+        service.handle_command("save_file", {"path": "/bytes/t.txt", "content": "héllo"})
+        stored = service._files["/bytes/t.txt"].content
+        text = service.handle_command("read_file", {"path": "/bytes/t.txt"})
+        results.add("Content stored as bytes",
+                   stored == "héllo".encode("utf-8") and
+                   text["content"] == "héllo" and
+                   text["content_encoding"] is None and
+                   text["metadata"]["encoding"] == "utf-8")
+    except Exception as e:
+        results.add("Content stored as bytes", False, str(e))
+
+    # Test 2.10: Raw read survives the RESULT message serialization
+    try:
+        import base64
+        import json
+        from unittest.mock import MagicMock
+        from mindbus.core import MindBus
+        service.handle_command("save_file", {"path": "/bytes/b.bin", "content": b"\x00\xffraw"})
+        raw = service.handle_command("read_file", {"path": "/bytes/b.bin"})
+        bus = MindBus()
+        bus._channel = MagicMock()
+        bus.send_result(output=raw, execution_time_ms=1, source="storage",
+                        reply_to="replies", correlation_id="c-1")
+        body = json.loads(bus._channel.basic_publish.call_args.kwargs["body"])
+        output = body["data"]["output"]
+        results.add("Raw read is base64 over the bus",
+                   output["content_encoding"] == "base64" and
+                   base64.b64decode(output["content"]) == b"\x00\xffraw")
+    except Exception as e:
+        results.add("Raw read is base64 over the bus", False, str(e))
+
 
 # =============================================================================
 # 3. Artifact Operations Tests
@@ -288,6 +436,31 @@ def test_artifact_operations():
     except Exception as e:
         results.add("List artifacts by process_id", False, str(e))
 
+    # Test 3.6: Combined filters and re-saving under a new task
+    try:
+        service.handle_command("save_artifact", {
+            "artifact_id": "idx-1", "task_id": "task-idx", "process_id": "proc-idx",
+            "artifact_type": "log", "data": {"n": 1},
+        })
+        service.handle_command("save_artifact", {
+            "artifact_id": "idx-2", "task_id": "task-idx", "process_id": "proc-idx",
+            "data": {"n": 2},
+        })
+        service.handle_command("save_artifact", {
+            "artifact_id": "idx-2", "task_id": "task-moved", "data": {"n": 3},
+        })
+        combined = service.handle_command("list_artifacts", {
+            "task_id": "task-idx", "process_id": "proc-idx", "artifact_type": "log",
+        })
+        old_task = service.handle_command("list_artifacts", {"task_id": "task-idx"})
+        new_task = service.handle_command("list_artifacts", {"task_id": "task-moved"})
+        results.add("Artifact index filters and re-save",
+                   [a["artifact_id"] for a in combined["artifacts"]] == ["idx-1"] and
+                   [a["artifact_id"] for a in old_task["artifacts"]] == ["idx-1"] and
+                   [a["artifact_id"] for a in new_task["artifacts"]] == ["idx-2"])
+    except Exception as e:
+        results.add("Artifact index filters and re-save", False, str(e))
+
 
 # =============================================================================
 # 4. Error Handling Tests
@@ -343,6 +516,16 @@ def test_error_handling():
     except Exception as e:
         results.add("Unknown action raises ValueError", False, str(type(e)))
 
+    # Test 4.6: Error classification by exception type
+    try:
+        results.add("Error codes and retryability",
+                   service._get_error_code(FileNotFoundError("x")) == "NOT_FOUND" and
+                   service._get_error_code(RuntimeError("x")) == "INTERNAL" and
+                   service._is_retryable(TimeoutError()) and
+                   not service._is_retryable(ValueError()))
+    except Exception as e:
+        results.add("Error codes and retryability", False, str(e))
+
 
 # =============================================================================
 # 5. Storage Limits Tests
@@ -446,6 +629,38 @@ def test_content_hash():
     except Exception as e:
         results.add("Different content = different hash", False, str(e))
 
+    # Test 6.4: Caller-provided hash is used as-is
+    try:
+        result = service.handle_command("save_file", {
+            "path": "/prehashed.txt",
+            "content": "hashed upstream",
+            "content_hash": "abc123",
+            "hash_algo": "sha256",
+        })
+        info = service.handle_command("get_file_info", {"path": "/prehashed.txt"})
+        results.add("Caller-provided hash kept",
+                   result["content_hash"] == "abc123" and
+                   info["metadata"]["hash_algo"] == "sha256")
+    except Exception as e:
+        results.add("Caller-provided hash kept", False, str(e))
+
+    # Test 6.5: Large files are hashed in the background
+    try:
+        service._async_hash_min_bytes = 16
+        big = "x" * 64
+        result = service.handle_command("save_file", {"path": "/big.txt", "content": big})
+        synced = service.handle_command("save_file", {
+            "path": "/big_sync.txt", "content": big, "sync_hash": True,
+        })
+        service._hash_executor.submit(lambda: None).result()  # drain queue
+        info = service.handle_command("get_file_info", {"path": "/big.txt"})
+        results.add("Large file hashed in background",
+                   result["hash_pending"] and result["content_hash"] is None and
+                   not synced["hash_pending"] and
+                   info["metadata"]["content_hash"] == synced["content_hash"])
+    except Exception as e:
+        results.add("Large file hashed in background", False, str(e))
+
 
 # =============================================================================
 # 7. Storage Stats Tests
@@ -483,6 +698,17 @@ def test_storage_stats():
     except Exception as e:
         results.add("Storage type is in-memory", False, str(e))
 
+    # Test 7.4: Total size tracks overwrite and delete
+    try:
+        service.handle_command("save_file", {"path": "/stats/f1.txt", "content": "hi"})
+        service.handle_command("save_file", {"path": "/stats/f3.txt", "content": "abc"})
+        service.handle_command("delete_file", {"path": "/stats/f2.txt"})
+        result = service.handle_command("get_stats", {})
+        results.add("Total size tracks overwrite/delete",
+                   result["stats"]["total_file_size_bytes"] == 5)
+    except Exception as e:
+        results.add("Total size tracks overwrite/delete", False, str(e))
+
 
 # =============================================================================
 # 8. Overwrite Behavior Tests
@@ -562,10 +562,11 @@ def start_registry_service():
 
         # Subscribe to node events
         registry_service.bus.subscribe("evt.node.registered", registry_service._on_node_registered)
-        registry_service.bus.subscribe("evt.node.heartbeat", registry_service._on_node_heartbeat)
+        registry_service.bus.subscribe("evt.node.heartbeat", registry_service._enqueue_heartbeat)
         registry_service.bus.subscribe("evt.node.deregistered", registry_service._on_node_deregistered)
 
-        # Start cleanup thread
+        # Start heartbeat batching and cleanup threads
+        registry_service._start_heartbeat_thread()
         registry_service.registry.start_cleanup_thread()
 
         # Start consuming in background
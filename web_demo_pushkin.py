@@ -812,9 +812,10 @@ def start_registry_service():
         registry_service.bus.connect()
 
         registry_service.bus.subscribe("evt.node.registered", registry_service._on_node_registered)
-        registry_service.bus.subscribe("evt.node.heartbeat", registry_service._on_node_heartbeat)
+        registry_service.bus.subscribe("evt.node.heartbeat", registry_service._enqueue_heartbeat)
         registry_service.bus.subscribe("evt.node.deregistered", registry_service._on_node_deregistered)
 
+        registry_service._start_heartbeat_thread()
         registry_service.registry.start_cleanup_thread()
 
         registry_thread = threading.Thread(